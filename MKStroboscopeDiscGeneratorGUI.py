@@ -5,26 +5,252 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QLabel, QPushButton, QScrollArea,
     QSpinBox, QDoubleSpinBox, QFileDialog, QGroupBox,
     QComboBox, QCheckBox, QRadioButton, QButtonGroup, QMessageBox,
-    QFrame
+    QFrame, QDialog, QPlainTextEdit, QInputDialog, QLineEdit, QListWidget,
+    QListWidgetItem
 )
 
-from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtCore import Qt, QSize, QTimer, QRectF, QThread, QByteArray, QBuffer, QIODevice, QEvent, pyqtSignal
 from PyQt6.QtSvgWidgets import QSvgWidget
-from PyQt6.QtGui import QResizeEvent, QGuiApplication
+from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtGui import (
+    QResizeEvent, QGuiApplication, QKeySequence, QShortcut, QImage, QPainter, QPixmap, QIcon,
+    QFont, QFontMetricsF, QPainterPath
+)
 import svgwrite
 import tempfile
 import os
+import io
+import time
+import json
+import hashlib
+import sqlite3
+from datetime import datetime
+import shutil
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import numpy as np
 
 # For PDF export
 from svglib.svglib import svg2rlg
 from reportlab.graphics import renderPDF
 from reportlab.lib.pagesizes import A4, LETTER, LEGAL, A3
 from reportlab.lib.units import mm
+from reportlab.graphics.shapes import Drawing, Group
+from reportlab.pdfgen import canvas as pdf_canvas
+
+# Optional, for reading video files in the speed measurement
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
 # Constants for sizes
 PREVIEW_PANEL_MARGIN_WIDTH = 20  # mm margin in the preview panel, width
 PREVIEW_PANEL_MARGIN_HEIGHT = 20  # mm margin in the preview panel, height
 
+# Paper formats for PDF export
+PAPER_SIZES = {"A4": A4, "Letter": LETTER, "Legal": LEGAL, "A3": A3}
+
+# PostScript export validation
+POSTSCRIPT_VALIDATION_DPI = 150
+POSTSCRIPT_VALIDATION_TOLERANCE = 0.02  # Maximum mean difference between the PostScript and SVG rasterizations
+POSTSCRIPT_VALIDATION_TIMEOUT = 120  # Seconds given to Ghostscript to rasterize an exported file
+
+# Ring labels
+LABEL_DEPTH_RATIO = 0.7  # Font size relative to the ring depth
+LABEL_MAX_FONT_SIZE = 3.5  # mm
+LABEL_STYLES = ("None", "Straight", "Curved")
+LABEL_FONT_FAMILY = "Arial"  # Any sans-serif font is used if it is missing
+LABEL_GLYPH_REFERENCE_SIZE = 100  # Pixel size the glyph outlines are extracted at
+LABEL_BASELINE_OFFSET = 0.35  # Baseline offset from the middle of the ring, relative to the font size
+LABEL_MAX_GAP = math.pi / 2  # Largest arc (radians) of a ring left without lines for its label
+
+# Calibration sheets
+CALIBRATION_MAX_RINGS = 2000  # Maximum number of rings of a calibration sheet
+CALIBRATION_MAX_SWEEP = 200000  # Maximum number of (rpm, hz) pairs evaluated for a calibration sheet
+CALIBRATION_MIN_RADIUS = 15  # mm, rings are not placed closer to the center
+
+# Mains frequency drift analysis
+DRIFT_HZ_BANDS = ((49.8, 50.2), (59.8, 60.2))  # Hz ranges swept for 50 Hz and 60 Hz mains
+DRIFT_HZ_STEP = 0.01  # Hz step of the sweep
+DRIFT_CHART_RPM_WINDOW = 0.02  # Charted RPM window around each ring's speed (fraction)
+
+# Undo history and preview cache
+UNDO_HISTORY_LIMIT = 1000  # Maximum number of undo steps kept
+PREVIEW_CACHE_SIZE = 32  # Number of rendered previews kept for instant undo/redo
+
+# Speed measurement
+SERIES_MAX_POINTS = 2000  # Points kept for the speed charts, whatever the input length
+VIDEO_SAMPLES_PER_LINE = 16  # Angular samples per line when resampling a ring
+VIDEO_RADIAL_SAMPLES = 3  # Circles sampled across each ring
+VIDEO_LOCATE_MAX_EDGES = 200000  # Edge pixels used to locate the disc in the first frame
+VIDEO_LOCATE_TOLERANCE = 2.0  # Pixels, distance from the center of the edges kept to locate the disc
+VIDEO_PATTERN_MIN_STRENGTH = 0.5  # Minimum share of a ring's brightness variation at its line frequency
+VIDEO_LIGHTING_MODES = (
+    ("Continuous light, short shutter", None),
+    ("50 Hz mains lamp", 50.0),
+    ("60 Hz mains lamp", 60.0),
+)
+FRAME_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+TONE_CHUNK_SIZE = 1 << 18  # Samples read from the WAV file at a time
+TONE_FILTER_TAPS = 511  # Length of the band-pass filter around the test tone
+TONE_BAND = 0.2  # Half width of the band-pass filter (fraction of the tone frequency)
+TONE_DEVIATION_RATE = 1000  # Hz, rate of the instantaneous frequency signal
+TONE_WEIGHTING_SECONDS = 4  # Length of the wow & flutter weighting filter
+# IEC 60386 / DIN 45507 wow & flutter weighting curve: (Hz, dB relative to 4 Hz)
+WOW_WEIGHTING_CURVE = (
+    (0.2, -30.6), (0.315, -22.5), (0.4, -19.0), (0.63, -13.4), (0.8, -10.5),
+    (1.0, -8.4), (1.6, -4.2), (2.0, -2.8), (4.0, 0.0), (6.3, -0.9), (10.0, -2.1),
+    (20.0, -5.9), (40.0, -10.4), (63.0, -14.2), (100.0, -17.3), (200.0, -23.0),
+)
+
+# Design library
+LIBRARY_PATH = os.path.join(os.path.expanduser("~"), ".strobodisccreator", "library.sqlite3")
+LIBRARY_RPM_TOLERANCE = 0.01  # RPM values closer than this match in searches
+THUMBNAIL_SIZE = 128  # Pixels
+LIBRARY_SEARCH_DELAY = 250  # ms after the last filter change before searching
+
+@dataclass(frozen=True)
+class RingSpec:
+    # Immutable snapshot of the settings of a single ring
+    rpm: float
+    hz: float
+    depth: float
+    single_mode: bool
+    manual_rpm: bool = False
+    label: str = ""  # Custom label text, the speed and frequency are used if empty
+    label_style: str = "none"  # "none", "straight" or "curved"
+    
+    @classmethod
+    def from_settings(cls, settings):
+        # Builds a ring spec from the dict returned by RingSettings.get_settings()
+        return cls(
+            rpm=settings['rpm'],
+            hz=settings['hz'],
+            depth=settings['depth'],
+            single_mode=settings['single_mode'],
+            manual_rpm=settings.get('manual_rpm', False),
+            label=settings.get('label', ""),
+            label_style=settings.get('label_style', "straight" if settings.get('label') else "none"),
+        )
+    
+    def to_settings(self):
+        # Returns the settings dict understood by RingSettings.set_settings()
+        return {
+            'rpm': self.rpm,
+            'hz': self.hz,
+            'depth': self.depth,
+            'single_mode': self.single_mode,
+            'manual_rpm': self.manual_rpm,
+            'label': self.label,
+            'label_style': self.label_style,
+        }
+
+@dataclass(frozen=True)
+class DiscSpec:
+    # Immutable snapshot of a whole disc design. Snapshots share unchanged
+    # RingSpec objects (and the rings tuple) with the previous one, so a long
+    # history costs little memory. Being hashable, a spec is also a cache key.
+    diameter: float
+    spindle_diameter: float
+    outer_circle_width: float
+    ring_separation: float
+    rings: tuple = ()
+    
+    def to_dict(self):
+        # Returns a JSON serializable representation of the spec
+        return {
+            'diameter': self.diameter,
+            'spindle_diameter': self.spindle_diameter,
+            'outer_circle_width': self.outer_circle_width,
+            'ring_separation': self.ring_separation,
+            'rings': [ring.to_settings() for ring in self.rings],
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        # Builds a spec from the representation returned by to_dict()
+        return cls(
+            diameter=data['diameter'],
+            spindle_diameter=data['spindle_diameter'],
+            outer_circle_width=data['outer_circle_width'],
+            ring_separation=data['ring_separation'],
+            rings=tuple(RingSpec.from_settings(ring) for ring in data['rings']),
+        )
+    
+    def spec_hash(self):
+        # Stable hash of the spec, used to key cached renders
+        return hashlib.sha1(json.dumps(self.to_dict(), sort_keys=True).encode('utf-8')).hexdigest()
+
+class SpecHistory:
+    # Undo/redo stack of DiscSpec snapshots
+    def __init__(self, limit=UNDO_HISTORY_LIMIT):
+        self.limit = limit
+        self.snapshots = []
+        self.position = -1
+    
+    def current(self):
+        # Returns the current snapshot, or None if the history is empty
+        if self.position < 0:
+            return None
+        return self.snapshots[self.position]
+    
+    def push(self, spec):
+        # Records a new snapshot, discarding the redo branch. Returns False if
+        # the spec is the same as the current one.
+        if spec == self.current():
+            return False
+        del self.snapshots[self.position + 1:]
+        self.snapshots.append(spec)
+        if len(self.snapshots) > self.limit:
+            del self.snapshots[0]
+        self.position = len(self.snapshots) - 1
+        return True
+    
+    def can_undo(self):
+        return self.position > 0
+    
+    def can_redo(self):
+        return self.position < len(self.snapshots) - 1
+    
+    def undo(self):
+        # Steps back and returns the previous snapshot
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self.snapshots[self.position]
+    
+    def redo(self):
+        # Steps forward and returns the next snapshot
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self.snapshots[self.position]
+
+class PreviewCache:
+    # Bounded LRU cache of rendered SVG previews keyed by DiscSpec
+    def __init__(self, max_size=PREVIEW_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+    
+    def get(self, spec):
+        # Returns the cached SVG for a spec, or None
+        svg = self.entries.get(spec)
+        if svg is not None:
+            self.entries.move_to_end(spec)
+        return svg
+    
+    def put(self, spec, svg):
+        # Stores the SVG for a spec, evicting the least recently used entry
+        self.entries[spec] = svg
+        self.entries.move_to_end(spec)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
 class RingSettings(QWidget):
     # Widget for configuring a single ring of lines
     def __init__(self, parent=None, index=0, on_delete=None, on_change=None):
@@ -106,6 +332,17 @@ class RingSettings(QWidget):
         hz_layout.addWidget(self.hz_combo)
         frame_layout.addLayout(hz_layout)
         
+        # Label with the speed and frequency
+        label_layout = QHBoxLayout()
+        label_label = QLabel("Label:")
+        self.label_combo = QComboBox()
+        self.label_combo.addItems(LABEL_STYLES)
+        self.label_combo.currentIndexChanged.connect(self.settings_changed)
+        
+        label_layout.addWidget(label_label)
+        label_layout.addWidget(self.label_combo)
+        frame_layout.addLayout(label_layout)
+        
         # Ring depth
         depth_layout = QHBoxLayout()
         depth_label = QLabel("Ring depth (mm):")
@@ -208,6 +445,19 @@ class RingSettings(QWidget):
         return (num_lines_exact, num_lines, num_lines_rpm, line_width, 
                 num_lines_floor, num_lines_ceil, num_lines_floor_rpm, num_lines_ceil_rpm)
     
+    def get_line_counts(self):
+        # Returns the number of lines of each set drawn for this ring
+        (num_lines_exact, num_lines, num_lines_rpm, line_width,
+         num_lines_floor, num_lines_ceil, num_lines_floor_rpm, num_lines_ceil_rpm) = self.calculate_segments_and_line_width(100)
+        if num_lines:
+            return [num_lines]
+        return [num_lines_floor, num_lines_ceil]
+    
+    def set_manual_rpm(self, rpm):
+        # Switches to manual RPM with the given value
+        self.rpm_input.setValue(rpm)
+        self.rpm_manual_check.setChecked(True)
+    
     def update_segments_info(self, radius=None):
         # Updates information about the number of segments and line width
         # Use a default radius if none provided
@@ -257,9 +507,2353 @@ class RingSettings(QWidget):
             'rpm': self.get_rpm_value(),
             'hz': self.get_hz_value(),
             'depth': self.get_depth_value(),
-            'single_mode': self.force_single_check.isChecked()
+            'single_mode': self.force_single_check.isChecked(),
+            'manual_rpm': self.rpm_manual_check.isChecked(),
+            'label_style': self.label_combo.currentText().lower()
+        }
+    
+    def set_settings(self, settings):
+        # Restores the settings of this ring without notifying the changes
+        widgets = (self.rpm_combo, self.rpm_manual_check, self.rpm_input,
+                   self.hz_combo, self.label_combo, self.depth_input, self.force_single_check)
+        for widget in widgets:
+            widget.blockSignals(True)
+        
+        rpm_text = f"{settings['rpm']:g}"
+        rpm_index = self.rpm_combo.findText(rpm_text)
+        manual_rpm = settings.get('manual_rpm', False) or rpm_index < 0
+        if rpm_index >= 0:
+            self.rpm_combo.setCurrentIndex(rpm_index)
+        self.rpm_manual_check.setChecked(manual_rpm)
+        self.rpm_input.setValue(settings['rpm'])
+        self.rpm_input.setEnabled(manual_rpm)
+        self.rpm_combo.setEnabled(not manual_rpm)
+        
+        self.hz_combo.setCurrentIndex(max(self.hz_combo.findText(f"{settings['hz']:g}"), 0))
+        self.label_combo.setCurrentIndex(max(self.label_combo.findText(settings.get('label_style', "none").capitalize()), 0))
+        self.depth_input.setValue(settings['depth'])
+        self.force_single_check.setChecked(settings['single_mode'])
+        
+        for widget in widgets:
+            widget.blockSignals(False)
+        self.update_segments_info()
+
+def calculate_lines_for_ring(ring, radius, ring_depth):
+    # Calculate the number of lines and line width for a ring
+    rpm = ring.rpm
+    hz = ring.hz
+    single_mode = ring.single_mode
+    
+    # Calculate the exact number of lines
+    num_lines_exact = (60 * hz) / rpm * 2
+    
+    # Calculate floor and ceiling number of lines
+    num_lines_floor = math.floor(num_lines_exact)
+    num_lines_ceil = math.ceil(num_lines_exact)
+    
+    # Determine if we're using single or double mode
+    if num_lines_floor == num_lines_ceil or single_mode:
+        if num_lines_floor == num_lines_ceil:
+            num_lines = num_lines_floor
+        else:
+            num_lines = round(num_lines_exact)
+        
+        # Calculate line width
+        circumference = 2 * math.pi * radius
+        line_width = circumference / (num_lines * 2)  # Half the segment width
+        
+        return {
+            'mode': 'single',
+            'num_lines': num_lines,
+            'line_width': line_width
+        }
+    else:
+        # Double mode
+        # Calculate line widths for both sets
+        outer_circumference = 2 * math.pi * radius
+        inner_circumference = 2 * math.pi * (radius - ring_depth)
+        
+        outer_line_width = outer_circumference / (num_lines_floor * 2)
+        inner_line_width = inner_circumference / (num_lines_ceil * 2)
+        
+        return {
+            'mode': 'double',
+            'outer_num_lines': num_lines_floor,
+            'outer_line_width': outer_line_width,
+            'inner_num_lines': num_lines_ceil,
+            'inner_line_width': inner_line_width
+        }
+
+def layout_disc(spec):
+    # Computes the radii and lines of every ring of a disc, from outside to inside
+    diameter = spec.diameter
+    spindle_diameter = spec.spindle_diameter
+    outer_circle_width = spec.outer_circle_width
+    
+    center = (diameter / 2, diameter / 2)
+    disc_radius = diameter / 2 - (outer_circle_width / 2 if outer_circle_width > 0 else 0)
+    current_radius = disc_radius - (outer_circle_width / 2 if outer_circle_width > 0 else 0)
+    
+    rings = []
+    for ring in spec.rings:
+        ring_depth = ring.depth
+        
+        # Calculate inner radius for this ring
+        inner_radius = current_radius - ring_depth
+        
+        # Ensure inner radius is not smaller than the spindle radius
+        if inner_radius < spindle_diameter / 2:
+            inner_radius = spindle_diameter / 2
+            ring_depth = current_radius - inner_radius
+        
+        rings.append({
+            'ring': ring,
+            'outer_radius': current_radius,
+            'inner_radius': inner_radius,
+            'depth': ring_depth,
+            'lines': calculate_lines_for_ring(ring, current_radius, ring_depth),
+        })
+        
+        # Update current radius for the next ring, applying separation
+        current_radius = inner_radius - spec.ring_separation
+    
+    return {
+        'center': center,
+        'disc_radius': disc_radius,
+        'rings': rings,
+    }
+
+class GlyphCache:
+    # Outlines of the label characters, keyed by (font, size, char), so labels
+    # are drawn as filled paths and render the same in every output without
+    # depending on the fonts installed. An outline is a list of path commands
+    # ('M', x, y), ('L', x, y) or ('C', x1, y1, x2, y2, x, y) in mm, with the
+    # origin on the baseline and y pointing down. The cache holds no Qt objects,
+    # so once filled it can be handed to worker processes.
+    def __init__(self, family=LABEL_FONT_FAMILY):
+        self.family = family
+        self.glyphs = {}
+    
+    def glyph(self, char, size):
+        # Returns the (outline, advance) of a character at a font size in mm
+        key = (self.family, round(size, 4), char)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            glyph = self.glyphs[key] = self.build_glyph(char, size)
+        return glyph
+    
+    def build_glyph(self, char, size):
+        # Extracts the outline of a character from Qt at a large size and scales it
+        font = QFont(self.family)
+        font.setStyleHint(QFont.StyleHint.SansSerif)
+        font.setPixelSize(LABEL_GLYPH_REFERENCE_SIZE)
+        scale = size / LABEL_GLYPH_REFERENCE_SIZE
+        path = QPainterPath()
+        path.addText(0, 0, font, char)
+        
+        outline = []
+        index = 0
+        while index < path.elementCount():
+            element = path.elementAt(index)
+            if element.isMoveTo():
+                outline.append(('M', element.x * scale, element.y * scale))
+            elif element.isLineTo():
+                outline.append(('L', element.x * scale, element.y * scale))
+            else:
+                # A curve is followed by two elements with its other points
+                points = [path.elementAt(index + offset) for offset in range(3)]
+                outline.append(('C',) + tuple(value * scale for point in points for value in (point.x, point.y)))
+                index += 2
+            index += 1
+        return outline, QFontMetricsF(font).horizontalAdvance(char) * scale
+
+GLYPH_CACHE = GlyphCache()
+
+def format_rpm(rpm):
+    # Formats a speed, writing thirds as fractions (33.33 -> 33⅓)
+    thirds = round(rpm * 3)
+    if thirds % 3 and abs(rpm * 3 - thirds) < 0.02:
+        return f"{thirds // 3}{'⅓' if thirds % 3 == 1 else '⅔'}"
+    return f"{rpm:.2f}".rstrip('0').rstrip('.')
+
+def ring_label_text(ring):
+    # Text of a ring's label: the custom text, or its speed and frequency
+    return ring.label or f"{format_rpm(ring.rpm)} @ {ring.hz:g} Hz"
+
+def label_layout(ring_layout, glyphs=None):
+    # Returns the text, style, font size, radius, angular gap (radians) and
+    # glyph placements of a ring's label, or None if the ring has no label. The
+    # label sits at the top of the ring and the lines inside the gap are left
+    # out. Each placement is (char, angle, offset): the glyph outline is shifted
+    # by offset along the baseline, then rotated clockwise by angle (degrees)
+    # around the center of the disc. The gap never exceeds LABEL_MAX_GAP: a
+    # straight label that does not fit is curved, and a curved one that does
+    # not fit is drawn smaller.
+    ring = ring_layout['ring']
+    if ring.label_style not in ("straight", "curved"):
+        return None
+    if glyphs is None:
+        glyphs = GLYPH_CACHE
+    text = ring_label_text(ring)
+    style = ring.label_style
+    font_size = min(ring_layout['depth'] * LABEL_DEPTH_RATIO, LABEL_MAX_FONT_SIZE)
+    radius = ring_layout['outer_radius'] - ring_layout['depth'] / 2
+    width = sum(glyphs.glyph(char, font_size)[1] for char in text)
+    
+    # Leave a margin of one character height on each side of the text
+    if style == "straight":
+        # The ends of a straight label reach furthest into the lines at the inner
+        # edge, and furthest out of the ring at the outer edge
+        ratio = (width / 2 + font_size) / max(ring_layout['inner_radius'], 1e-6)
+        if ratio <= math.sin(LABEL_MAX_GAP / 2) and \
+                math.hypot(width / 2, radius + font_size / 2) <= ring_layout['outer_radius']:
+            gap = 2 * math.asin(ratio)
+        else:
+            style = "curved"
+    if style == "curved":
+        gap = (width + 2 * font_size) / max(radius, 1e-6)
+        if gap > LABEL_MAX_GAP:
+            # Both the text width and the margins scale with the font size
+            font_size *= LABEL_MAX_GAP / gap
+            gap = LABEL_MAX_GAP
+    
+    baseline = max(radius - font_size * LABEL_BASELINE_OFFSET, 1e-6)
+    advances = [glyphs.glyph(char, font_size)[1] for char in text]
+    width = sum(advances)
+    placements = []
+    x = -width / 2
+    for char, advance in zip(text, advances):
+        if style == "straight":
+            placements.append((char, 0, x))
+        else:
+            # Stand every glyph upright on the arc, centered on its angle
+            placements.append((char, math.degrees((x + advance / 2) / baseline), -advance / 2))
+        x += advance
+    
+    return {
+        'text': text,
+        'style': style,
+        'font_size': font_size,
+        'radius': radius,
+        'baseline': baseline,
+        'gap': gap,
+        'placements': placements,
+    }
+
+def svg_path_data(outline):
+    # Converts a glyph outline to SVG path data, closing every contour
+    parts = []
+    for command in outline:
+        if command[0] == 'M' and parts:
+            parts.append("Z")
+        parts.append(command[0] + " ".join(f"{value:.4f}" for value in command[1:]))
+    if parts:
+        parts.append("Z")
+    return " ".join(parts)
+
+def add_label_glyphs(dwg, glyph_defs, label, center, glyphs):
+    # Adds the glyphs of a label, defining each outline once per drawing in
+    # glyph_defs and placing it with a transform
+    for char, angle, offset in label['placements']:
+        key = (char, label['font_size'])
+        if key not in glyph_defs:
+            outline = glyphs.glyph(char, label['font_size'])[0]
+            glyph_defs[key] = dwg.defs.add(dwg.path(
+                d=svg_path_data(outline), id=f"glyph{len(glyph_defs)}", fill='black'
+            )) if outline else None
+        if glyph_defs[key] is not None:
+            dwg.add(dwg.use(glyph_defs[key], transform=(
+                f"translate({center[0]:.4f} {center[1]:.4f}) rotate({angle:.4f}) "
+                f"translate({offset:.4f} {-label['baseline']:.4f})"
+            )))
+
+def add_tick_lines(dwg, center, outer_radius, inner_radius, num_lines, line_width, gap=0):
+    # Adds a set of evenly spaced radial lines, skipping those inside the label gap
+    angles = np.radians(np.arange(num_lines) * (360 / num_lines))
+    if gap > 0:
+        angles = angles[np.minimum(angles, 2 * np.pi - angles) > gap / 2]
+    sin = np.sin(angles)
+    cos = np.cos(angles)
+    
+    # Outer endpoint (x1, y1) and inner endpoint (x2, y2) of every line
+    x1 = (center[0] + outer_radius * sin).tolist()
+    y1 = (center[1] - outer_radius * cos).tolist()
+    x2 = (center[0] + inner_radius * sin).tolist()
+    y2 = (center[1] - inner_radius * cos).tolist()
+    
+    stroke = svgwrite.rgb(0, 0, 0, "%")
+    for line in zip(x1, y1, x2, y2):
+        dwg.add(dwg.line(line[:2], line[2:], stroke=stroke, stroke_width=line_width))
+
+def render_disc_svg(spec, glyphs=None):
+    # Renders a disc spec as an SVG document and returns it as a string. Labels
+    # take their outlines from glyphs, the shared GLYPH_CACHE by default.
+    if glyphs is None:
+        glyphs = GLYPH_CACHE
+    glyph_defs = {}
+    diameter = spec.diameter
+    spindle_diameter = spec.spindle_diameter
+    outer_circle_width = spec.outer_circle_width
+    layout = layout_disc(spec)
+    center = layout['center']
+    
+    # Attribute validation is skipped: it is slow with thousands of lines
+    dwg = svgwrite.Drawing(
+        size=(f"{diameter}mm", f"{diameter}mm"),
+        profile="tiny",
+        viewBox=f"0 0 {diameter} {diameter}",
+        debug=False,
+    )
+    
+    # Draw Outer Circle
+    if outer_circle_width > 0:
+        dwg.add(dwg.circle(
+            center=center, 
+            r=layout['disc_radius'], 
+            fill='none', 
+            stroke='black', 
+            stroke_width=outer_circle_width
+        ))
+    
+    # Draw each ring from outside to inside
+    for ring_layout in layout['rings']:
+        current_radius = ring_layout['outer_radius']
+        inner_radius = ring_layout['inner_radius']
+        ring_depth = ring_layout['depth']
+        lines_info = ring_layout['lines']
+        label = label_layout(ring_layout, glyphs)
+        gap = label['gap'] if label else 0
+        
+        if lines_info['mode'] == 'single':
+            # Draw single set of lines
+            add_tick_lines(dwg, center, current_radius, inner_radius,
+                           lines_info['num_lines'], lines_info['line_width'], gap)
+        else:
+            # Draw double set of lines, the outer set down to the middle of the ring
+            mid_radius = current_radius - ring_depth / 2
+            add_tick_lines(dwg, center, current_radius, mid_radius,
+                           lines_info['outer_num_lines'], lines_info['outer_line_width'], gap)
+            add_tick_lines(dwg, center, mid_radius, inner_radius,
+                           lines_info['inner_num_lines'], lines_info['inner_line_width'], gap)
+        
+        if label:
+            add_label_glyphs(dwg, glyph_defs, label, center, glyphs)
+    
+    # Draw Spindle Hole
+    dwg.add(dwg.circle(
+        center=center, 
+        r=spindle_diameter/2, 
+        fill='black', 
+        stroke='black', 
+        stroke_width=0.2
+    ))
+    
+    output = io.StringIO()
+    dwg.write(output)
+    return output.getvalue()
+
+def build_pdf_page_drawing(svg_path, disc_diameter_mm, pagesize):
+    # Converts an SVG disc to a ReportLab drawing of the page size, with the disc
+    # centered on the page without scaling (maintaining the exact size in mm)
+    drawing = svg2rlg(svg_path)
+    
+    # Get the disc diameter in points (1 mm = 2.83465 points)
+    disc_diameter_pt = disc_diameter_mm * 2.83465
+    
+    # Get page dimensions in points
+    page_width, page_height = pagesize
+    
+    # Calculate the position to center the disc on the page
+    x_offset = (page_width - disc_diameter_pt) / 2
+    y_offset = (page_height - disc_diameter_pt) / 2
+    
+    # Create a new drawing with the page size
+    new_drawing = Drawing(page_width, page_height)
+    
+    # Center the original drawing without scaling
+    group = Group(drawing)
+    # Scale the drawing to match the desired size in points
+    scale_factor = disc_diameter_pt / drawing.width
+    group.scale(scale_factor, scale_factor)
+    group.translate(x_offset, y_offset)
+    
+    # Add the centered group to the new drawing
+    new_drawing.add(group)
+    return new_drawing
+
+def render_disc_postscript(spec, pagesize=None, glyphs=None):
+    # Renders a disc spec as PostScript and returns it as a string. Every set of
+    # lines is drawn by a loop that rotates a single line, so the size of the
+    # file does not depend on the number of lines. Without a page size the
+    # output is an EPS file whose bounding box is the disc; with a page size it
+    # is a one page PostScript document with the disc centered on the page.
+    # Label glyphs are defined once as procedures and placed by transforms. All
+    # the names are defined in a private dictionary, so an EPS placed in another
+    # document does not clobber the names of its host.
+    if glyphs is None:
+        glyphs = GLYPH_CACHE
+    glyph_procedures = {}
+    glyph_definitions = []
+    diameter = spec.diameter
+    disc_size_pt = diameter * 72 / 25.4
+    layout = layout_disc(spec)
+    
+    if pagesize is None:
+        page_width = page_height = disc_size_pt
+        header = [
+            "%!PS-Adobe-3.0 EPSF-3.0",
+            f"%%BoundingBox: 0 0 {math.ceil(page_width)} {math.ceil(page_height)}",
+            f"%%HiResBoundingBox: 0 0 {page_width:.4f} {page_height:.4f}",
+        ]
+    else:
+        page_width, page_height = pagesize
+        header = [
+            "%!PS-Adobe-3.0",
+            f"%%BoundingBox: 0 0 {math.ceil(page_width)} {math.ceil(page_height)}",
+            f"%%DocumentMedia: Plain {page_width:.2f} {page_height:.2f} 0 () ()",
+        ]
+    
+    # Page body, built first to know which glyphs the prolog must define
+    lines = []
+    
+    # Outer circle
+    if spec.outer_circle_width > 0:
+        lines.append(f"{layout['disc_radius']:.4f} {spec.outer_circle_width:.4f} circle")
+    
+    # Rings, from outside to inside
+    for ring_layout in layout['rings']:
+        current_radius = ring_layout['outer_radius']
+        inner_radius = ring_layout['inner_radius']
+        lines_info = ring_layout['lines']
+        label = label_layout(ring_layout, glyphs)
+        half_gap = math.degrees(label['gap']) / 2 if label else 0
+        
+        if lines_info['mode'] == 'single':
+            lines.append(f"{lines_info['num_lines']} {current_radius:.4f} {inner_radius:.4f} "
+                         f"{lines_info['line_width']:.5f} {half_gap:.4f} ticks")
+        else:
+            mid_radius = current_radius - ring_layout['depth'] / 2
+            lines.append(f"{lines_info['outer_num_lines']} {current_radius:.4f} {mid_radius:.4f} "
+                         f"{lines_info['outer_line_width']:.5f} {half_gap:.4f} ticks")
+            lines.append(f"{lines_info['inner_num_lines']} {mid_radius:.4f} {inner_radius:.4f} "
+                         f"{lines_info['inner_line_width']:.5f} {half_gap:.4f} ticks")
+        
+        if label:
+            for char, angle, offset in label['placements']:
+                key = (char, label['font_size'])
+                if key not in glyph_procedures:
+                    # Define each glyph outline once, as a procedure that fills it
+                    outline = glyphs.glyph(char, label['font_size'])[0]
+                    glyph_procedures[key] = f"g{len(glyph_procedures)}" if outline else None
+                    if outline:
+                        glyph_definitions.append(f"/{glyph_procedures[key]} {{ newpath")
+                        for command in outline:
+                            # PostScript coordinates point up
+                            values = (value if i % 2 == 0 else -value for i, value in enumerate(command[1:]))
+                            glyph_definitions.append(
+                                " ".join(f"{value:.4f}" for value in values) + " " + command[0].lower()
+                            )
+                        glyph_definitions.append("closepath fill } bind def")
+                if glyph_procedures[key]:
+                    lines.append(f"gsave {-angle:.4f} rotate {offset:.4f} {label['baseline']:.4f} translate "
+                                 f"{glyph_procedures[key]} grestore")
+    
+    # Spindle hole
+    lines.append(f"newpath 0 0 {spec.spindle_diameter / 2:.4f} 0 360 arc closepath "
+                 "gsave fill grestore 0.2 setlinewidth stroke")
+    
+    prolog = header + [
+        "%%Title: Multi-Ring Stroboscopic Disc",
+        "%%Creator: MKStroboscopeDiscGeneratorGUI",
+        "%%Pages: 1",
+        "%%EndComments",
+        "%%BeginProlog",
+        f"/MKStroboDict {16 + len(glyph_procedures)} dict def",
+        "MKStroboDict begin",
+        "% count outer_radius inner_radius line_width half_gap ticks -",
+        "% Draws count radial lines clockwise from the top, skipping those",
+        "% closer than half_gap degrees to the top (label gap)",
+        "/ticks {",
+        "  /tick_gap exch def setlinewidth /tick_inner exch def /tick_outer exch def /tick_count exch def",
+        "  0 1 tick_count 1 sub {",
+        "    360 mul tick_count div /tick_angle exch def",
+        "    tick_gap 0 le tick_angle tick_gap gt tick_angle 360 tick_gap sub lt and or {",
+        "      gsave tick_angle neg rotate newpath 0 tick_outer moveto 0 tick_inner lineto stroke grestore",
+        "    } if",
+        "  } for",
+        "} bind def",
+        "% radius line_width circle -",
+        "/circle { setlinewidth newpath 0 exch 0 exch 0 360 arc closepath stroke } bind def",
+        "% Short names for the label outlines",
+        "/m { closepath moveto } bind def /l { lineto } bind def /c { curveto } bind def",
+        "% Glyph outlines of the labels",
+    ] + glyph_definitions + [
+        "end",
+        "%%EndProlog",
+        "%%Page: 1 1",
+        "MKStroboDict begin",
+        "gsave",
+        # Work in mm with the origin at the center of the disc
+        f"{page_width / 2:.4f} {page_height / 2:.4f} translate",
+        "72 25.4 div dup scale",
+        "0 setlinecap 0 setgray",
+    ]
+    
+    return "\n".join(prolog + lines + [
+        "grestore",
+        "end",
+        "showpage",
+        "%%EOF",
+        "",
+    ])
+
+def find_postscript_interpreter():
+    # Returns the path of a local Ghostscript executable, or None
+    for name in ("gs", "gswin64c", "gswin32c"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+def validate_postscript(postscript_path, svg, disc_diameter_mm, dpi=POSTSCRIPT_VALIDATION_DPI, progress=None):
+    # Rasterizes an exported EPS or PS file with Ghostscript and compares it
+    # with the SVG of the disc, rasterized at the same size and centered the same
+    # way. Returns None if no interpreter is available, otherwise a dict with the
+    # mean difference (0-1) and the fraction of differing pixels. Raises
+    # RuntimeError if the interpreter fails, times out or is cancelled through
+    # the progress callback (see BackgroundTask).
+    interpreter = find_postscript_interpreter()
+    if interpreter is None:
+        return None
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        png_path = os.path.join(temp_dir, "disc.png")
+        process = subprocess.Popen(
+            [interpreter, "-q", "-dSAFER", "-dBATCH", "-dNOPAUSE", "-dEPSCrop", "-sDEVICE=pnggray",
+             f"-r{dpi}", "-dGraphicsAlphaBits=4", "-dTextAlphaBits=4", f"-sOutputFile={png_path}",
+             postscript_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        deadline = time.monotonic() + POSTSCRIPT_VALIDATION_TIMEOUT
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=0.25)
+                break
+            except subprocess.TimeoutExpired:
+                cancelled = progress is not None and not progress(0)
+                if cancelled or time.monotonic() > deadline:
+                    process.kill()
+                    process.communicate()
+                    raise RuntimeError("The validation was cancelled." if cancelled
+                                       else "Ghostscript did not finish in time.")
+        if process.returncode != 0:
+            raise RuntimeError(f"Ghostscript failed: {stderr.decode(errors='replace').strip() or process.returncode}")
+        postscript_image = QImage(png_path)
+        if postscript_image.isNull():
+            raise RuntimeError("The PostScript interpreter did not produce an image.")
+    
+    # Rasterize the SVG to the same size
+    svg_image = QImage(postscript_image.width(), postscript_image.height(), QImage.Format.Format_ARGB32)
+    svg_image.fill(Qt.GlobalColor.white)
+    disc_size = disc_diameter_mm / 25.4 * dpi
+    painter = QPainter(svg_image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    QSvgRenderer(QByteArray(svg.encode('utf-8'))).render(painter, QRectF(
+        (svg_image.width() - disc_size) / 2, (svg_image.height() - disc_size) / 2, disc_size, disc_size
+    ))
+    painter.end()
+    
+    difference = np.abs(qimage_to_gray_array(postscript_image) - qimage_to_gray_array(svg_image)) / 255
+    mean_difference = float(difference.mean())
+    return {
+        'mean_difference': mean_difference,
+        'differing_pixels': float((difference > 0.5).mean()),
+        'passed': mean_difference <= POSTSCRIPT_VALIDATION_TOLERANCE,
+    }
+
+class BackgroundTask(QThread):
+    # Runs a long computation in a worker thread so the UI does not stall.
+    # The function receives a "progress" callback that takes a percentage and
+    # returns False once the task has been cancelled.
+    task_finished = pyqtSignal(object)
+    task_failed = pyqtSignal(str)
+    task_progress = pyqtSignal(int)
+    
+    def __init__(self, function, *args, parent=None):
+        super().__init__(parent)
+        self.function = function
+        self.args = args
+    
+    def report_progress(self, value):
+        # Forward the progress to the UI thread and tell the task whether to continue
+        self.task_progress.emit(int(value))
+        return not self.isInterruptionRequested()
+    
+    def run(self):
+        try:
+            result = self.function(*self.args, progress=self.report_progress)
+        except Exception as e:
+            self.task_failed.emit(str(e))
+            return
+        self.task_finished.emit(result)
+
+class DriftAnalysisEngine:
+    # Sweeps the apparent drift of every ring over speed and mains frequency.
+    # A ring with N lines passes N * rpm / 60 lines per second under a lamp that
+    # flickers at 2 * hz. The lamp samples the pattern, so the drift seen is that
+    # rate minus 2 * hz folded into [-hz, hz) lines per second; positive values
+    # mean the pattern drifts in the direction of rotation.
+    # Each ring is only swept over the band of its own mains frequency. The
+    # full grid is never kept: results hold the summary and the (float32)
+    # chart curves, and export_csv() recomputes the grid row by row.
+    def __init__(self, rings, rpm_min=1, rpm_max=100, rpm_step=0.01, hz_step=DRIFT_HZ_STEP):
+        # rings: list of dicts with 'rpm', 'hz' and 'line_counts' for each ring
+        self.rings = rings
+        self.rpm_values = np.arange(rpm_min, rpm_max + rpm_step / 2, rpm_step)
+        self.hz_step = hz_step
+        self.results = []
+    
+    @staticmethod
+    def drift_lines_per_second(rpm, hz, num_lines):
+        # Apparent drift in lines per second (broadcasts over NumPy arrays)
+        return ((num_lines * rpm / 60 + hz) % (2 * hz)) - hz
+    
+    @staticmethod
+    def lines_to_degrees(drift_lines, num_lines):
+        # Converts a drift in lines per second to degrees per second
+        return drift_lines * 360 / num_lines
+    
+    @staticmethod
+    def hz_band(hz):
+        # Returns the drift band that contains the nominal frequency
+        for hz_min, hz_max in DRIFT_HZ_BANDS:
+            if hz_min <= hz <= hz_max:
+                return hz_min, hz_max
+        return hz, hz
+    
+    def band_hz_values(self, hz):
+        # Frequencies swept for a ring made for the nominal frequency
+        hz_min, hz_max = self.hz_band(hz)
+        return np.arange(hz_min, hz_max + self.hz_step / 2, self.hz_step)
+    
+    def drift_row(self, result, hz):
+        # Drift in lines per second of a result's line count over all swept speeds
+        return self.drift_lines_per_second(self.rpm_values, hz, result['num_lines'])
+    
+    def combination_count(self):
+        # Number of (rpm, hz, line count) combinations in the sweep
+        return len(self.rpm_values) * sum(
+            len(self.band_hz_values(ring['hz'])) * len(ring['line_counts']) for ring in self.rings
+        )
+    
+    def run(self, progress=None):
+        # Computes the drift summary and chart curves for every line count of every ring
+        self.results = []
+        total = max(sum(len(ring['line_counts']) for ring in self.rings), 1)
+        for ring_index, ring in enumerate(self.rings):
+            hz_min, hz_max = self.hz_band(ring['hz'])
+            
+            # Charted RPM window around the ring's speed, at most ~400 points per curve
+            start, stop = np.searchsorted(self.rpm_values, [ring['rpm'] * (1 - DRIFT_CHART_RPM_WINDOW),
+                                                            ring['rpm'] * (1 + DRIFT_CHART_RPM_WINDOW)])
+            chart_rpm = self.rpm_values[start:stop:max((stop - start) // 400, 1)]
+            
+            for num_lines in ring['line_counts']:
+                # Drift at the ring's own speed, at nominal frequency and at the band edges
+                band_hz = np.array([hz_min, ring['hz'], hz_max])
+                band_drift = self.drift_lines_per_second(ring['rpm'], band_hz, num_lines)
+                chart_drift = self.drift_lines_per_second(
+                    chart_rpm[np.newaxis, :], band_hz[:, np.newaxis], num_lines
+                ).astype(np.float32)
+                
+                self.results.append({
+                    'ring': ring_index,
+                    'rpm': ring['rpm'],
+                    'hz': ring['hz'],
+                    'num_lines': num_lines,
+                    'hz_values': self.band_hz_values(ring['hz']),
+                    'chart_rpm': chart_rpm,
+                    'chart_drift': chart_drift,
+                    'band_hz': band_hz,
+                    'band_drift': band_drift,
+                    # Speeds at which the pattern stands still at the band edges
+                    'still_rpm': (120 * band_hz) / num_lines,
+                })
+                if progress and not progress(100 * len(self.results) / total):
+                    return self.results
+        return self.results
+    
+    def summary_text(self):
+        # Builds a plain text report of the drift of every ring
+        lines = [f"Swept {self.combination_count():,} combinations "
+                 f"({len(self.rpm_values):,} RPM values x the {self.hz_step:g} Hz steps of each ring's band)", ""]
+        for result in self.results:
+            num_lines = result['num_lines']
+            lines.append(f"Ring {result['ring'] + 1}: {result['rpm']:g} rpm @ {result['hz']:g} Hz, {num_lines} lines")
+            for hz, drift, still_rpm in zip(result['band_hz'], result['band_drift'], result['still_rpm']):
+                lines.append(
+                    f"  {hz:6.2f} Hz: {drift:+8.3f} lines/s  "
+                    f"{self.lines_to_degrees(drift, num_lines):+8.3f} deg/s  "
+                    f"(still at {still_rpm:.3f} rpm)"
+                )
+            lines.append("")
+        return "\n".join(lines)
+    
+    def export_csv(self, file_path, progress=None):
+        # Writes the full sweep as CSV, one block of rows per (ring, line count, frequency)
+        total = max(sum(len(result['hz_values']) for result in self.results), 1)
+        done = 0
+        with open(file_path, 'w') as f:
+            f.write("ring,line_count,hz,rpm,drift_lines_per_s,drift_deg_per_s\n")
+            for result in self.results:
+                num_lines = result['num_lines']
+                for hz in result['hz_values']:
+                    drift = self.drift_row(result, hz)
+                    block = np.column_stack((
+                        np.full(drift.shape, result['ring'] + 1),
+                        np.full(drift.shape, num_lines),
+                        np.full(drift.shape, hz),
+                        self.rpm_values,
+                        drift,
+                        self.lines_to_degrees(drift, num_lines),
+                    ))
+                    np.savetxt(f, block, fmt=['%d', '%d', '%.2f', '%.4f', '%.6f', '%.6f'], delimiter=',')
+                    done += 1
+                    if progress and not progress(100 * done / total):
+                        return file_path
+        return file_path
+    
+    def chart_svg(self):
+        # Draws the drift (deg/s) around each ring's speed at the band edges and nominal frequency
+        panel_width = 200
+        panel_height = 70
+        margin = 14
+        height = max(len(self.results), 1) * (panel_height + margin) + margin
+        dwg = svgwrite.Drawing(size=(f"{panel_width + 2 * margin}mm", f"{height}mm"),
+                               viewBox=f"0 0 {panel_width + 2 * margin} {height}", debug=False)
+        dwg.add(dwg.rect((0, 0), (panel_width + 2 * margin, height), fill='white'))
+        colors = ('blue', 'black', 'red')
+        
+        for panel, result in enumerate(self.results):
+            x0 = margin
+            y0 = margin + panel * (panel_height + margin)
+            num_lines = result['num_lines']
+            
+            # RPM window around the ring's speed
+            rpm = result['chart_rpm']
+            if len(rpm) < 2:
+                continue
+            curves = [self.lines_to_degrees(row, num_lines) for row in result['chart_drift']]
+            y_limit = max(max(np.abs(curve).max() for curve in curves), 1e-6)
+            
+            def to_point(r, d):
+                x = x0 + (r - rpm[0]) / (rpm[-1] - rpm[0]) * panel_width
+                y = y0 + panel_height / 2 - d / y_limit * panel_height / 2
+                return (round(float(x), 2), round(float(y), 2))
+            
+            # Frame, zero line and nominal speed marker
+            dwg.add(dwg.rect((x0, y0), (panel_width, panel_height), fill='none', stroke='gray', stroke_width=0.3))
+            dwg.add(dwg.line(to_point(rpm[0], 0), to_point(rpm[-1], 0), stroke='gray', stroke_width=0.2))
+            dwg.add(dwg.line(to_point(result['rpm'], y_limit), to_point(result['rpm'], -y_limit),
+                             stroke='gray', stroke_width=0.2, stroke_dasharray="1,1"))
+            
+            for color, hz, curve in zip(colors, result['band_hz'], curves):
+                dwg.add(dwg.polyline([to_point(r, d) for r, d in zip(rpm, curve)],
+                                     fill='none', stroke=color, stroke_width=0.4))
+            
+            title = (f"Ring {result['ring'] + 1}: {num_lines} lines, "
+                     f"{result['rpm']:g} rpm @ {result['hz']:g} Hz "
+                     f"(blue {result['band_hz'][0]:.2f} Hz, red {result['band_hz'][2]:.2f} Hz)")
+            dwg.add(dwg.text(title, insert=(x0, y0 - 2), font_size=4, font_family='sans-serif'))
+            dwg.add(dwg.text(f"±{y_limit:.1f} deg/s", insert=(x0 + 1, y0 + 5), font_size=3.5, font_family='sans-serif'))
+            dwg.add(dwg.text(f"{rpm[0]:.2f} rpm", insert=(x0, y0 + panel_height + 4.5), font_size=3.5, font_family='sans-serif'))
+            dwg.add(dwg.text(f"{rpm[-1]:.2f} rpm", insert=(x0 + panel_width, y0 + panel_height + 4.5),
+                             font_size=3.5, font_family='sans-serif', text_anchor='end'))
+        
+        return dwg.tostring()
+
+class AnalysisDialog(QDialog):
+    # Base dialog for analyses that run in a BackgroundTask. Subclasses create
+    # self.status_label and self.chart_widget and override set_busy().
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.task = None
+        # Free the results (and the task) as soon as the dialog is closed
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    
+    def set_busy(self, busy):
+        # Enable or disable the controls while a task is running
+        pass
+    
+    def start_task(self, function, *args, on_finished=None):
+        # Run a function in the background, updating the status label with its progress
+        self.task = BackgroundTask(function, *args, parent=self)
+        self.task.task_progress.connect(lambda value: self.status_label.setText(f"Working... {value}%"))
+        self.task.task_failed.connect(self.task_failed)
+        self.task.task_finished.connect(on_finished)
+        self.set_busy(True)
+        self.task.start()
+    
+    def show_chart(self, svg):
+        # Display an SVG chart keeping its aspect ratio at the current width
+        self.chart_widget.load(QByteArray(svg.encode('utf-8')))
+        size = self.chart_widget.renderer().defaultSize()
+        self.chart_widget.setMinimumHeight(int(size.height() * max(self.chart_widget.width(), 1) / max(size.width(), 1)))
+    
+    def task_failed(self, message):
+        self.set_busy(False)
+        self.status_label.setText("")
+        QMessageBox.critical(self, "Error", f"Error: {message}")
+    
+    def stop_task(self):
+        # Stop the background task, if any, and wait for it
+        if self.task and self.task.isRunning():
+            self.task.requestInterruption()
+            self.task.wait()
+    
+    def done(self, result):
+        # Called by accept() and reject(), which also handle Esc and closing the window
+        self.stop_task()
+        super().done(result)
+
+class DriftAnalysisDialog(AnalysisDialog):
+    # Dialog that runs the drift sweep in the background and charts the result
+    def __init__(self, rings, parent=None):
+        super().__init__(parent)
+        self.rings = rings
+        self.engine = None
+        self.setWindowTitle("Mains Frequency Drift Analysis")
+        self.setMinimumSize(900, 700)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        
+        # Sweep range
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(QLabel("RPM from:"))
+        self.rpm_min_input = QDoubleSpinBox()
+        self.rpm_min_input.setRange(1, 100)
+        self.rpm_min_input.setValue(1)
+        self.rpm_min_input.setDecimals(2)
+        range_layout.addWidget(self.rpm_min_input)
+        
+        range_layout.addWidget(QLabel("to:"))
+        self.rpm_max_input = QDoubleSpinBox()
+        self.rpm_max_input.setRange(1, 100)
+        self.rpm_max_input.setValue(100)
+        self.rpm_max_input.setDecimals(2)
+        range_layout.addWidget(self.rpm_max_input)
+        
+        range_layout.addWidget(QLabel("step:"))
+        self.rpm_step_input = QDoubleSpinBox()
+        self.rpm_step_input.setRange(0.001, 1)
+        self.rpm_step_input.setValue(0.01)
+        self.rpm_step_input.setDecimals(3)
+        self.rpm_step_input.setSingleStep(0.001)
+        range_layout.addWidget(self.rpm_step_input)
+        
+        self.run_button = QPushButton("Run Analysis")
+        self.run_button.clicked.connect(self.run_analysis)
+        range_layout.addWidget(self.run_button)
+        main_layout.addLayout(range_layout)
+        
+        self.status_label = QLabel("Mains frequency bands: " + ", ".join(
+            f"{hz_min}-{hz_max} Hz" for hz_min, hz_max in DRIFT_HZ_BANDS))
+        main_layout.addWidget(self.status_label)
+        
+        # Chart
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        self.chart_widget = QSvgWidget()
+        self.chart_widget.setMinimumHeight(300)
+        scroll_area.setWidget(self.chart_widget)
+        main_layout.addWidget(scroll_area, 2)
+        
+        # Report
+        self.report_text = QPlainTextEdit()
+        self.report_text.setReadOnly(True)
+        font = self.report_text.font()
+        font.setFamily("monospace")
+        self.report_text.setFont(font)
+        main_layout.addWidget(self.report_text, 1)
+        
+        self.export_button = QPushButton("Export CSV")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(self.export_csv)
+        main_layout.addWidget(self.export_button)
+    
+    def set_busy(self, busy):
+        # Enable or disable the controls while a task is running
+        self.run_button.setEnabled(not busy)
+        self.export_button.setEnabled(not busy and self.engine is not None and bool(self.engine.results))
+    
+    def run_analysis(self):
+        if self.rpm_max_input.value() <= self.rpm_min_input.value():
+            QMessageBox.warning(self, "Warning", "The maximum RPM must be greater than the minimum RPM.")
+            return
+        self.engine = DriftAnalysisEngine(
+            self.rings,
+            rpm_min=self.rpm_min_input.value(),
+            rpm_max=self.rpm_max_input.value(),
+            rpm_step=self.rpm_step_input.value(),
+        )
+        self.start_task(self.engine.run, on_finished=self.analysis_finished)
+    
+    def analysis_finished(self, results):
+        self.set_busy(False)
+        self.status_label.setText(f"Analysis finished: {self.engine.combination_count():,} combinations")
+        self.report_text.setPlainText(self.engine.summary_text())
+        self.show_chart(self.engine.chart_svg())
+    
+    def export_csv(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Drift Analysis", "", "CSV Files (*.csv)")
+        if not file_path:
+            return
+        if not file_path.endswith(".csv"):
+            file_path += ".csv"
+        self.start_task(self.engine.export_csv, file_path, on_finished=self.export_finished)
+    
+    def export_finished(self, file_path):
+        self.set_busy(False)
+        self.status_label.setText(f"File saved successfully to {file_path}")
+
+def render_series_chart_svg(x_values, y_values, title, x_label, y_label, reference=None):
+    # Draws a simple line chart of a series as an SVG string
+    width = 200
+    height = 80
+    margin = 14
+    dwg = svgwrite.Drawing(size=(f"{width + 2 * margin}mm", f"{height + 2 * margin}mm"),
+                           viewBox=f"0 0 {width + 2 * margin} {height + 2 * margin}", debug=False)
+    dwg.add(dwg.rect((0, 0), (width + 2 * margin, height + 2 * margin), fill='white'))
+    dwg.add(dwg.rect((margin, margin), (width, height), fill='none', stroke='gray', stroke_width=0.3))
+    dwg.add(dwg.text(title, insert=(margin, margin - 3), font_size=4, font_family='sans-serif'))
+    
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    if len(x_values) < 2:
+        return dwg.tostring()
+    
+    x_min, x_max = x_values.min(), x_values.max()
+    y_min, y_max = y_values.min(), y_values.max()
+    if reference is not None:
+        y_min, y_max = min(y_min, reference), max(y_max, reference)
+    y_pad = max((y_max - y_min) * 0.1, 1e-6)
+    y_min, y_max = y_min - y_pad, y_max + y_pad
+    x_span = max(x_max - x_min, 1e-9)
+    
+    def to_point(x, y):
+        return (round(float(margin + (x - x_min) / x_span * width), 2),
+                round(float(margin + height - (y - y_min) / (y_max - y_min) * height), 2))
+    
+    if reference is not None:
+        dwg.add(dwg.line(to_point(x_min, reference), to_point(x_max, reference),
+                         stroke='gray', stroke_width=0.2, stroke_dasharray="1,1"))
+    dwg.add(dwg.polyline([to_point(x, y) for x, y in zip(x_values, y_values)],
+                         fill='none', stroke='blue', stroke_width=0.4))
+    
+    # Axis labels
+    label_style = {'font_size': 3.5, 'font_family': 'sans-serif'}
+    dwg.add(dwg.text(f"{y_max:.3f}", insert=(margin + 1, margin + 4), **label_style))
+    dwg.add(dwg.text(f"{y_min:.3f} {y_label}", insert=(margin + 1, margin + height - 1.5), **label_style))
+    dwg.add(dwg.text(f"{x_min:.1f}", insert=(margin, margin + height + 4.5), **label_style))
+    dwg.add(dwg.text(f"{x_max:.1f} {x_label}", insert=(margin + width, margin + height + 4.5),
+                     text_anchor='end', **label_style))
+    return dwg.tostring()
+
+class SeriesBuffer:
+    # Fixed-size buffer of a time series. When it fills up, adjacent points are
+    # averaged in pairs and the decimation doubles, so memory stays constant
+    # whatever the length of the input.
+    def __init__(self, max_points=SERIES_MAX_POINTS):
+        self.max_points = max_points
+        self.times = []
+        self.values = []
+        self.decimation = 1
+        self.pending_time = 0.0
+        self.pending_value = 0.0
+        self.pending_count = 0
+    
+    def append(self, time, value):
+        # Adds a point, averaging it with its neighbours according to the decimation
+        self.pending_time += time
+        self.pending_value += value
+        self.pending_count += 1
+        if self.pending_count < self.decimation:
+            return
+        self.times.append(self.pending_time / self.pending_count)
+        self.values.append(self.pending_value / self.pending_count)
+        self.pending_time = self.pending_value = 0.0
+        self.pending_count = 0
+        if len(self.times) >= self.max_points:
+            self.times = [(a + b) / 2 for a, b in zip(self.times[::2], self.times[1::2])]
+            self.values = [(a + b) / 2 for a, b in zip(self.values[::2], self.values[1::2])]
+            self.decimation *= 2
+
+class RunningStats:
+    # Running mean, standard deviation and range (Welford's algorithm)
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+    
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+    
+    def add_array(self, values):
+        # Adds a block of values at once (Chan's parallel combination)
+        count = len(values)
+        if count == 0:
+            return
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+    
+    def std(self):
+        return math.sqrt(self.m2 / self.count) if self.count > 1 else 0.0
+
+def qimage_to_gray_array(image):
+    # Converts a QImage to a 2D float32 NumPy array of gray levels
+    image = image.convertToFormat(QImage.Format.Format_Grayscale8)
+    pointer = image.constBits()
+    pointer.setsize(image.sizeInBytes())
+    array = np.frombuffer(pointer, dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+    return array[:, :image.width()].astype(np.float32)
+
+def open_frame_source(path, fps):
+    # Opens a video file or a folder of frames. Returns (frames, fps, frame_count),
+    # where frames is a generator of 2D gray level arrays read one at a time.
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if os.path.splitext(name)[1].lower() in FRAME_IMAGE_EXTENSIONS
+        )
+        if not files:
+            raise ValueError("The folder does not contain any image frames.")
+        
+        def frames():
+            for file_path in files:
+                image = QImage(file_path)
+                if image.isNull():
+                    raise ValueError(f"Cannot read the frame '{file_path}'.")
+                yield qimage_to_gray_array(image)
+        
+        return frames(), fps, len(files)
+    
+    if cv2 is None:
+        raise ValueError("Reading video files requires OpenCV (pip install opencv-python). "
+                         "You can export the video as a folder of frames instead.")
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError(f"Cannot open the video '{path}'.")
+    video_fps = capture.get(cv2.CAP_PROP_FPS) or fps
+    frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    
+    def frames():
+        try:
+            while True:
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                yield cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY).astype(np.float32)
+        finally:
+            capture.release()
+    
+    return frames(), video_fps, frame_count
+
+class VideoSpeedAnalyzer:
+    # Measures the platter speed from frames of a spinning disc made with this
+    # generator. Each line set of the spec is resampled along circles in polar
+    # coordinates; the phase of its N-th angular harmonic gives the rotation of
+    # the disc modulo 360/N degrees. The frame-to-frame rotation is unwrapped
+    # around the rotation expected at the nominal speed.
+    # The disc must be seen from above, dark lines on a lighter background.
+    # Lighting matters: with continuous light (daylight, LED or DC lamps) and a
+    # short shutter every frame shows the true position of the disc. Under a
+    # mains lamp (lamp_hz) the lines are only seen at the flashes, 2 * lamp_hz
+    # per second, so the frames show the slow drift of the pattern instead, and
+    # the speed is (2 * lamp_hz + drift in lines per second) * 60 / N, using the
+    # rings made for that frequency. Using the wrong mode gives wrong speeds.
+    def __init__(self, spec, nominal_rpm, fps, lamp_hz=None):
+        self.spec = spec
+        self.nominal_rpm = nominal_rpm
+        self.fps = fps
+        self.lamp_hz = lamp_hz
+        self.tracks = []
+        self.previous_phases = None
+        self.frame_index = 0
+        self.center = None
+        self.scale = None  # Pixels per mm
+        self.stats = RunningStats()
+        self.series = SeriesBuffer()
+        
+        # Radial bands (outer radius, inner radius, number of lines, ring frequency) of every line set
+        layout = layout_disc(spec)
+        self.bands = []
+        for ring_layout in layout['rings']:
+            lines_info = ring_layout['lines']
+            outer_radius = ring_layout['outer_radius']
+            inner_radius = ring_layout['inner_radius']
+            hz = ring_layout['ring'].hz
+            if lines_info['mode'] == 'single':
+                self.bands.append((outer_radius, inner_radius, lines_info['num_lines'], hz))
+            else:
+                mid_radius = outer_radius - ring_layout['depth'] / 2
+                self.bands.append((outer_radius, mid_radius, lines_info['outer_num_lines'], hz))
+                self.bands.append((mid_radius, inner_radius, lines_info['inner_num_lines'], hz))
+        
+        # Outer radius of the outermost lines, used to find the scale of the image
+        if not layout['rings']:
+            raise ValueError("The current design has no rings.")
+        self.edge_radius = layout['rings'][0]['outer_radius']
+    
+    def locate_disc(self, gray):
+        # Finds the center and scale of the disc from the edges of its lines,
+        # ignoring whatever surrounds it. The edges of radial lines point at the
+        # center, and so do the normals of the circle edges: the center is the
+        # point closest to all those edge lines, found by least squares while
+        # edges far from the current estimate (the background) are dropped.
+        gy, gx = np.gradient(gray.astype(np.float32))
+        magnitude = np.hypot(gx, gy)
+        strong = magnitude > max(np.percentile(magnitude, 90), 1e-3)
+        ys, xs = np.nonzero(strong)
+        if len(xs) < 100:
+            raise ValueError("Cannot find the disc in the first frame: the image has no contrast.")
+        stride = max(len(xs) // VIDEO_LOCATE_MAX_EDGES, 1)
+        ys, xs = ys[::stride].astype(np.float64), xs[::stride].astype(np.float64)
+        weights = magnitude[strong][::stride].astype(np.float64)
+        nx = gx[strong][::stride] / weights
+        ny = gy[strong][::stride] / weights
+        
+        # Edges whose line passes far from the center are the background, or the
+        # circles seen from a wrong center; the tolerance tightens every pass
+        keep = np.ones(len(xs), dtype=bool)
+        tolerance = np.hypot(*gray.shape)
+        for _ in range(8):
+            w = weights[keep]
+            a = np.array([[np.sum(w * nx[keep] * nx[keep]), np.sum(w * nx[keep] * ny[keep])],
+                          [np.sum(w * nx[keep] * ny[keep]), np.sum(w * ny[keep] * ny[keep])]])
+            projection = w * (nx[keep] * xs[keep] + ny[keep] * ys[keep])
+            b = np.array([np.sum(projection * nx[keep]), np.sum(projection * ny[keep])])
+            try:
+                center_x, center_y = np.linalg.solve(a, b)
+            except np.linalg.LinAlgError:
+                raise ValueError("Cannot find the disc in the first frame: no radial lines were found.")
+            residual = np.abs(nx * (xs - center_x) + ny * (ys - center_y))
+            tolerance = max(tolerance / 3, VIDEO_LOCATE_TOLERANCE)
+            keep = residual < tolerance
+            if np.count_nonzero(keep) < 100:
+                raise ValueError("Cannot find the disc in the first frame: no radial lines were found.")
+        
+        # Radial line edges have their gradient across the radius. Their density
+        # per unit of circumference drops to nothing outside the outermost ring.
+        dx = xs - center_x
+        dy = ys - center_y
+        distances = np.hypot(dx, dy)
+        across = np.abs(nx * dy - ny * dx) / np.maximum(distances, 1e-9)
+        radial = (across > 0.9) & (residual < VIDEO_LOCATE_TOLERANCE)
+        if np.count_nonzero(radial) < 100:
+            raise ValueError("Cannot find the disc in the first frame: no radial lines were found.")
+        max_distance = int(distances[radial].max()) + 2
+        density = np.bincount(distances[radial].astype(np.intp), weights[radial], max_distance)
+        density /= np.maximum(np.arange(max_distance), 1)
+        outer_edge = np.nonzero(density > density.max() * 0.2)[0].max()
+        if outer_edge < 10:
+            raise ValueError("Cannot find the disc in the first frame: the disc is too small.")
+        self.center = (center_x, center_y)
+        self.scale = outer_edge / self.edge_radius
+    
+    def prepare_tracks(self, shape):
+        # Precomputes the bilinear sampling coordinates of every line set
+        height, width = shape
+        center_x, center_y = self.center
+        self.tracks = []
+        for outer_radius, inner_radius, num_lines, hz in self.bands:
+            if self.lamp_hz and abs(hz - self.lamp_hz) > 0.01:
+                continue  # Under the lamp, only the rings made for its frequency stand almost still
+            samples = max(VIDEO_SAMPLES_PER_LINE * num_lines, 256)
+            angles = np.arange(samples) * (2 * np.pi / samples)
+            # Sample across the middle of the band, away from its edges
+            radii = np.linspace(inner_radius, outer_radius, VIDEO_RADIAL_SAMPLES + 2)[1:-1] * self.scale
+            if radii[0] < 2:
+                continue
+            xs = center_x + radii[:, np.newaxis] * np.sin(angles)
+            ys = center_y - radii[:, np.newaxis] * np.cos(angles)
+            if xs.min() < 0 or ys.min() < 0 or xs.max() > width - 2 or ys.max() > height - 2:
+                continue  # Band partially outside of the frame
+            x0 = np.floor(xs).astype(np.intp)
+            y0 = np.floor(ys).astype(np.intp)
+            self.tracks.append({
+                'num_lines': num_lines,
+                'x0': x0,
+                'y0': y0,
+                'fx': (xs - x0).astype(np.float32),
+                'fy': (ys - y0).astype(np.float32),
+                'kernel': np.exp(-1j * num_lines * angles),
+            })
+        if not self.tracks and self.lamp_hz and not any(abs(band[3] - self.lamp_hz) <= 0.01 for band in self.bands):
+            raise ValueError(f"No ring of the current design is made for a {self.lamp_hz:g} Hz lamp.")
+        if not self.tracks:
+            raise ValueError(
+                f"The disc was found at ({center_x:.0f}, {center_y:.0f}) with a radius of "
+                f"{self.edge_radius * self.scale:.0f} pixels, but none of its rings fit inside the frame."
+            )
+    
+    def track_profile(self, track, gray):
+        # Samples the brightness around a track, averaged across its circles
+        x0, y0, fx, fy = track['x0'], track['y0'], track['fx'], track['fy']
+        top = gray[y0, x0] * (1 - fx) + gray[y0, x0 + 1] * fx
+        bottom = gray[y0 + 1, x0] * (1 - fx) + gray[y0 + 1, x0 + 1] * fx
+        return (top * (1 - fy) + bottom * fy).mean(axis=0)
+    
+    def check_tracks(self, gray):
+        # Makes sure the line pattern of the design is found where it is expected,
+        # comparing the N-th harmonic with the whole variation of each profile
+        for track in self.tracks:
+            profile = self.track_profile(track, gray)
+            variation = np.sqrt(np.sum((profile - profile.mean()) ** 2) * len(profile) / 2)
+            if np.abs(np.dot(profile, track['kernel'])) > VIDEO_PATTERN_MIN_STRENGTH * variation:
+                return
+        raise ValueError(
+            f"The lines of the current design were not found around the disc found at "
+            f"({self.center[0]:.0f}, {self.center[1]:.0f}). Check that the design matches "
+            f"the disc in the video and that the disc is seen from above."
+        )
+    
+    def track_phases(self, gray):
+        # Returns the phase and magnitude of the line pattern of every track
+        phases = []
+        weights = []
+        for track in self.tracks:
+            harmonic = np.dot(self.track_profile(track, gray), track['kernel'])
+            phases.append(np.angle(harmonic))
+            weights.append(np.abs(harmonic))
+        return np.array(phases), np.array(weights)
+    
+    def process_frame(self, gray):
+        # Updates the measurement with a new frame. Returns the speed (rpm)
+        # measured since the previous frame, or None for the first frame.
+        if self.center is None:
+            self.locate_disc(gray)
+            self.prepare_tracks(gray.shape)
+            self.check_tracks(gray)
+        
+        phases, weights = self.track_phases(gray)
+        rpm = None
+        if self.previous_phases is not None:
+            num_lines = np.array([track['num_lines'] for track in self.tracks])
+            period = 2 * np.pi / num_lines
+            
+            # Rotation modulo 360/N, between -180/N and 180/N
+            rotation = -np.angle(np.exp(1j * (phases - self.previous_phases))) / num_lines
+            if self.lamp_hz:
+                # The lines seen move by the drift of the pattern under the flashes
+                drift_lines = rotation / period * self.fps
+                rpm = float(np.average((2 * self.lamp_hz + drift_lines) * 60 / num_lines, weights=weights + 1e-12))
+            else:
+                # Unwrapped around the rotation expected at the nominal speed
+                expected = 2 * np.pi * self.nominal_rpm / 60 / self.fps
+                rotation = expected + (rotation - expected + period / 2) % period - period / 2
+                rotation = np.average(rotation, weights=weights + 1e-12)
+                rpm = rotation / (2 * np.pi) * self.fps * 60
+            self.stats.add(rpm)
+            self.series.append(self.frame_index / self.fps, rpm)
+        
+        self.previous_phases = phases
+        self.frame_index += 1
+        return rpm
+    
+    def result(self):
+        # Returns the measurement summary
+        values = np.array(self.series.values)
+        mean_rpm = self.stats.mean
+        if len(values) and mean_rpm:
+            # Peak wow from the smoothed series, RMS from every frame
+            wow_peak = (values.max() - values.min()) / 2 / mean_rpm * 100
+        else:
+            wow_peak = 0.0
+        return {
+            'frames': self.frame_index,
+            'mean_rpm': mean_rpm,
+            'std_rpm': self.stats.std(),
+            'min_rpm': self.stats.minimum,
+            'max_rpm': self.stats.maximum,
+            'wow_peak': wow_peak,
+            'wow_rms': self.stats.std() / mean_rpm * 100 if mean_rpm else 0.0,
+            'times': list(self.series.times),
+            'values': list(self.series.values),
+        }
+    
+    def run(self, path, progress=None):
+        # Processes a whole video or folder of frames, one frame at a time
+        frames, fps, frame_count = open_frame_source(path, self.fps)
+        self.fps = fps
+        for gray in frames:
+            self.process_frame(gray)
+            if progress and self.frame_index % 10 == 0:
+                if not progress(100 * self.frame_index / frame_count if frame_count > 0 else 0):
+                    frames.close()
+                    break
+        if self.stats.count == 0:
+            raise ValueError("At least two frames are needed to measure the speed.")
+        return self.result()
+
+class VideoSpeedDialog(AnalysisDialog):
+    # Dialog that measures the platter speed from a video of the spinning disc
+    def __init__(self, spec, on_apply_rpm=None, parent=None):
+        super().__init__(parent)
+        self.spec = spec
+        self.on_apply_rpm = on_apply_rpm
+        self.source_path = None
+        self.result = None
+        self.setWindowTitle("Speed Measurement from Video")
+        self.setMinimumSize(800, 600)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        
+        # Source selection
+        source_layout = QHBoxLayout()
+        open_video_button = QPushButton("Open Video...")
+        open_video_button.clicked.connect(self.choose_video)
+        open_folder_button = QPushButton("Open Frames Folder...")
+        open_folder_button.clicked.connect(self.choose_folder)
+        source_layout.addWidget(open_video_button)
+        source_layout.addWidget(open_folder_button)
+        main_layout.addLayout(source_layout)
+        
+        self.source_label = QLabel("No video selected")
+        main_layout.addWidget(self.source_label)
+        
+        lighting_note = QLabel(
+            "Film the disc from above. Choose the lighting the video was taken with: the speed is computed "
+            "differently under a flickering mains lamp, and the wrong choice gives wrong speeds."
+        )
+        lighting_note.setWordWrap(True)
+        main_layout.addWidget(lighting_note)
+        
+        # Measurement parameters
+        params_layout = QHBoxLayout()
+        params_layout.addWidget(QLabel("Nominal RPM:"))
+        self.nominal_rpm_input = QDoubleSpinBox()
+        self.nominal_rpm_input.setRange(1, 100)
+        self.nominal_rpm_input.setDecimals(2)
+        self.nominal_rpm_input.setValue(self.spec.rings[0].rpm if self.spec.rings else 33.33)
+        params_layout.addWidget(self.nominal_rpm_input)
+        
+        params_layout.addWidget(QLabel("Frames per second:"))
+        self.fps_input = QDoubleSpinBox()
+        self.fps_input.setRange(1, 1000)
+        self.fps_input.setDecimals(3)
+        self.fps_input.setValue(30)
+        self.fps_input.setToolTip("Used for folders of frames; video files provide their own frame rate")
+        params_layout.addWidget(self.fps_input)
+        
+        params_layout.addWidget(QLabel("Lighting:"))
+        self.lighting_combo = QComboBox()
+        for text, lamp_hz in VIDEO_LIGHTING_MODES:
+            self.lighting_combo.addItem(text, lamp_hz)
+        self.lighting_combo.setToolTip(
+            "Continuous light: daylight, DC or flicker-free LED lamps, with a shutter of 1/1000 s or shorter.\n"
+            "Mains lamp: the stroboscope lamp the disc is made for; the rings for its frequency are used."
+        )
+        params_layout.addWidget(self.lighting_combo)
+        
+        self.run_button = QPushButton("Measure")
+        self.run_button.setEnabled(False)
+        self.run_button.clicked.connect(self.run_analysis)
+        params_layout.addWidget(self.run_button)
+        main_layout.addLayout(params_layout)
+        
+        self.status_label = QLabel("")
+        main_layout.addWidget(self.status_label)
+        
+        # Chart and results
+        self.chart_widget = QSvgWidget()
+        self.chart_widget.setMinimumHeight(250)
+        main_layout.addWidget(self.chart_widget, 1)
+        
+        self.result_label = QLabel("")
+        main_layout.addWidget(self.result_label)
+        
+        # Apply the measured speed to a ring
+        apply_layout = QHBoxLayout()
+        apply_layout.addWidget(QLabel("Apply to:"))
+        self.ring_combo = QComboBox()
+        self.ring_combo.addItems([f"Ring {i + 1}" for i in range(len(self.spec.rings))])
+        apply_layout.addWidget(self.ring_combo)
+        self.apply_button = QPushButton("Use as Manual RPM")
+        self.apply_button.setEnabled(False)
+        self.apply_button.clicked.connect(self.apply_rpm)
+        apply_layout.addWidget(self.apply_button)
+        main_layout.addLayout(apply_layout)
+    
+    def set_busy(self, busy):
+        self.run_button.setEnabled(not busy and self.source_path is not None)
+        self.apply_button.setEnabled(not busy and self.result is not None)
+    
+    def choose_video(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Open Video", "", "Video Files (*.mp4 *.mov *.avi *.mkv *.webm);;All Files (*)"
+        )
+        if file_path:
+            self.set_source(file_path)
+    
+    def choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Open Frames Folder")
+        if folder:
+            self.set_source(folder)
+    
+    def set_source(self, path):
+        self.source_path = path
+        self.source_label.setText(path)
+        self.set_busy(False)
+    
+    def run_analysis(self):
+        self.result = None
+        analyzer = VideoSpeedAnalyzer(self.spec, self.nominal_rpm_input.value(), self.fps_input.value(),
+                                      lamp_hz=self.lighting_combo.currentData())
+        self.start_task(analyzer.run, self.source_path, on_finished=self.analysis_finished)
+    
+    def analysis_finished(self, result):
+        self.result = result
+        self.set_busy(False)
+        self.status_label.setText(f"Analyzed {result['frames']} frames")
+        self.result_label.setText(
+            f"Average speed: {result['mean_rpm']:.3f} rpm "
+            f"({(result['mean_rpm'] / self.nominal_rpm_input.value() - 1) * 100:+.2f}%)\n"
+            f"Range: {result['min_rpm']:.3f} - {result['max_rpm']:.3f} rpm\n"
+            f"Wow: ±{result['wow_peak']:.2f}% peak, {result['wow_rms']:.2f}% RMS"
+        )
+        self.show_chart(render_series_chart_svg(
+            result['times'], result['values'], "Platter speed", "s", "rpm", reference=self.nominal_rpm_input.value()
+        ))
+    
+    def apply_rpm(self):
+        # Offer the measured speed back as the manual RPM of the selected ring
+        if self.result and self.on_apply_rpm:
+            self.on_apply_rpm(self.ring_combo.currentIndex(), round(self.result['mean_rpm'], 2))
+
+class WavFile:
+    # Memory-mapped PCM or float WAV file. Samples are read in chunks, so files
+    # of any length can be processed without loading them into RAM.
+    def __init__(self, path):
+        self.path = path
+        audio_format = None
+        data_offset = None
+        with open(path, 'rb') as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                raise ValueError("The file is not a WAV file.")
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    break
+                chunk_id = chunk_header[:4]
+                chunk_size = int.from_bytes(chunk_header[4:], 'little')
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size)
+                    audio_format = int.from_bytes(fmt[0:2], 'little')
+                    self.channels = int.from_bytes(fmt[2:4], 'little')
+                    self.sample_rate = int.from_bytes(fmt[4:8], 'little')
+                    self.block_align = int.from_bytes(fmt[12:14], 'little')
+                    self.bits = int.from_bytes(fmt[14:16], 'little')
+                    if audio_format == 0xFFFE and len(fmt) >= 26:
+                        # WAVE_FORMAT_EXTENSIBLE: the format is the start of the sub-format GUID
+                        audio_format = int.from_bytes(fmt[24:26], 'little')
+                elif chunk_id == b'data':
+                    data_offset = f.tell()
+                    file_size = os.fstat(f.fileno()).st_size
+                    data_size = min(chunk_size, file_size - data_offset)
+                    break
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+        
+        if audio_format is None or data_offset is None:
+            raise ValueError("The WAV file has no format or data chunk.")
+        if audio_format not in (1, 3) or (audio_format == 3 and self.bits not in (32, 64)) \
+                or (audio_format == 1 and self.bits not in (8, 16, 24, 32)):
+            raise ValueError(f"Unsupported WAV format ({audio_format}, {self.bits} bits).")
+        
+        self.audio_format = audio_format
+        self.frame_count = data_size // self.block_align
+        self.data = np.memmap(path, dtype=np.uint8, mode='r', offset=data_offset,
+                              shape=(self.frame_count, self.block_align))
+    
+    def duration(self):
+        return self.frame_count / self.sample_rate
+    
+    def read(self, start, count, channel=0):
+        # Returns the samples of one channel as float64 in the range -1..1
+        sample_bytes = self.bits // 8
+        raw = np.ascontiguousarray(
+            self.data[start:start + count, channel * sample_bytes:(channel + 1) * sample_bytes]
+        )
+        if self.audio_format == 3:
+            return raw.view('<f4' if self.bits == 32 else '<f8')[:, 0].astype(np.float64)
+        if self.bits == 8:
+            return (raw[:, 0].astype(np.float64) - 128) / 128
+        if self.bits == 24:
+            # Sign-extend the three little-endian bytes into 32 bit integers
+            padded = np.zeros((len(raw), 4), dtype=np.uint8)
+            padded[:, 1:] = raw
+            return padded.view('<i4')[:, 0].astype(np.float64) / 2 ** 31
+        dtype = '<i2' if self.bits == 16 else '<i4'
+        return raw.view(dtype)[:, 0].astype(np.float64) / 2 ** (self.bits - 1)
+
+class WowFlutterWeighting:
+    # IEC 60386 / DIN 45507 wow & flutter weighting as a linear phase FIR filter,
+    # frequency-sampled from the standard curve (interpolated on a log frequency
+    # scale and extended with its end slopes). The input is the speed deviation
+    # averaged over bins of 1 / sample_rate; the sinc response of that averaging
+    # is compensated, so the whole chain follows the curve up to 200 Hz.
+    # Streaming (overlap-save): the filter only outputs fully convolved values,
+    # so the first TONE_WEIGHTING_SECONDS of input are used to settle it.
+    def __init__(self, sample_rate):
+        self.sample_rate = sample_rate
+        taps = int(TONE_WEIGHTING_SECONDS * sample_rate) | 1
+        frequencies = np.fft.rfftfreq(taps, 1 / sample_rate)
+        gain = 10 ** (self.curve_db(frequencies) / 20) / np.sinc(frequencies / sample_rate)
+        gain[0] = 0.0
+        kernel = np.roll(np.fft.irfft(gain, taps), taps // 2) * np.hanning(taps)
+        
+        # Window smoothing moves the response slightly: make it exactly 0 dB at 4 Hz
+        z = np.exp(-2j * np.pi * 4 / sample_rate * np.arange(taps))
+        self.kernel = kernel / (abs(np.sum(kernel * z)) * np.sinc(4 / sample_rate))
+        self.history = np.zeros(0)
+    
+    @staticmethod
+    def curve_db(frequencies):
+        # Weighting in dB at the given frequencies
+        log_hz = np.log(np.maximum(frequencies, 1e-6))
+        curve_hz = np.log([point[0] for point in WOW_WEIGHTING_CURVE])
+        curve_db = np.array([point[1] for point in WOW_WEIGHTING_CURVE])
+        low_slope = (curve_db[1] - curve_db[0]) / (curve_hz[1] - curve_hz[0])
+        high_slope = (curve_db[-1] - curve_db[-2]) / (curve_hz[-1] - curve_hz[-2])
+        result = np.interp(log_hz, curve_hz, curve_db)
+        result = np.where(log_hz < curve_hz[0], curve_db[0] + low_slope * (log_hz - curve_hz[0]), result)
+        return np.where(log_hz > curve_hz[-1], curve_db[-1] + high_slope * (log_hz - curve_hz[-1]), result)
+    
+    def process(self, values):
+        # Filters a block of values and returns the weighted values that are complete
+        block = np.concatenate((self.history, values))
+        overlap = len(self.kernel) - 1
+        if len(block) <= overlap:
+            self.history = block
+            return np.zeros(0)
+        fft_size = 1 << int(math.ceil(math.log2(len(block))))
+        filtered = np.fft.irfft(np.fft.rfft(block, fft_size) * np.fft.rfft(self.kernel, fft_size), fft_size)
+        self.history = block[-overlap:]
+        return filtered[overlap:len(block)]
+
+class ToneSpeedAnalyzer:
+    # Measures the speed of a turntable from a recorded test tone. The tone is
+    # band-pass filtered (FFT overlap-save), its instantaneous frequency is taken
+    # from the interpolated rising zero crossings and averaged over short bins.
+    # Everything is streamed chunk by chunk with a constant amount of state.
+    def __init__(self, reference_hz=3150, chunk_size=TONE_CHUNK_SIZE):
+        self.reference_hz = reference_hz
+        self.chunk_size = chunk_size
+    
+    def band_pass_kernel(self, sample_rate):
+        # Windowed-sinc band-pass around the reference frequency
+        taps = TONE_FILTER_TAPS
+        n = np.arange(taps) - (taps - 1) / 2
+        low = self.reference_hz * (1 - TONE_BAND) / sample_rate
+        high = self.reference_hz * (1 + TONE_BAND) / sample_rate
+        kernel = 2 * high * np.sinc(2 * high * n) - 2 * low * np.sinc(2 * low * n)
+        return kernel * np.hanning(taps)
+    
+    def run(self, path, progress=None):
+        wav = WavFile(path)
+        sample_rate = wav.sample_rate
+        if self.reference_hz * (1 + TONE_BAND) >= sample_rate / 2:
+            raise ValueError("The sample rate of the file is too low for the reference tone.")
+        
+        kernel = self.band_pass_kernel(sample_rate)
+        overlap = len(kernel) - 1
+        fft_size = 1 << int(math.ceil(math.log2(self.chunk_size + overlap)))
+        kernel_fft = np.fft.rfft(kernel, fft_size)
+        delay = overlap / 2  # Group delay of the linear phase filter, in samples
+        
+        bin_size = sample_rate / TONE_DEVIATION_RATE  # Samples per frequency bin
+        weighting = WowFlutterWeighting(TONE_DEVIATION_RATE)
+        speed_stats = RunningStats()
+        weighted_stats = RunningStats()
+        series = SeriesBuffer()
+        
+        history = np.zeros(overlap)  # Input tail carried between chunks (overlap-save)
+        last_sample = 0.0
+        last_crossing = None
+        open_bin = None  # [bin index, frequency sum, count] of the bin still being filled
+        last_ratio = None
+        
+        position = 0
+        while position < wav.frame_count:
+            count = min(self.chunk_size, wav.frame_count - position)
+            samples = wav.read(position, count)
+            
+            # Band-pass filter, keeping only the fully convolved samples
+            block = np.concatenate((history, samples))
+            filtered = np.fft.irfft(np.fft.rfft(block, fft_size) * kernel_fft, fft_size)[overlap:overlap + count]
+            history = block[-overlap:]
+            
+            # Rising zero crossings, with linear interpolation between samples
+            signal = np.concatenate(([last_sample], filtered))
+            index = np.nonzero((signal[:-1] < 0) & (signal[1:] >= 0))[0]
+            index = index[position - 1 + index >= overlap]  # Skip the start-up of the filter
+            fraction = signal[index] / (signal[index] - signal[index + 1])
+            crossings = position - 1 + index + fraction - delay
+            last_sample = filtered[-1]
+            
+            if last_crossing is not None:
+                crossings = np.concatenate(([last_crossing], crossings))
+            if len(crossings):
+                last_crossing = crossings[-1]
+            
+            if len(crossings) > 1:
+                frequencies = sample_rate / np.diff(crossings)
+                bins = ((crossings[:-1] + crossings[1:]) / 2 / bin_size).astype(np.int64)
+                
+                # Average the frequency of every bin, carrying the last (incomplete) one
+                first_bin = bins[0] if open_bin is None else min(open_bin[0], bins[0])
+                sums = np.bincount(bins - first_bin, weights=frequencies)
+                counts = np.bincount(bins - first_bin).astype(np.float64)
+                if open_bin is not None:
+                    sums[open_bin[0] - first_bin] += open_bin[1]
+                    counts[open_bin[0] - first_bin] += open_bin[2]
+                open_bin = [first_bin + len(sums) - 1, sums[-1], counts[-1]]
+                sums, counts = sums[:-1], counts[:-1]
+                
+                if len(sums):
+                    # Bins without crossings (drop-outs) repeat the previous value
+                    ratios = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0) / self.reference_hz
+                    if last_ratio is None:
+                        last_ratio = ratios[counts > 0][0] if np.any(counts > 0) else 1.0
+                    for i in np.nonzero(counts == 0)[0]:
+                        ratios[i] = ratios[i - 1] if i > 0 else last_ratio
+                    last_ratio = ratios[-1]
+                    
+                    speed_stats.add_array(ratios)
+                    weighted_stats.add_array(weighting.process(ratios - 1))
+                    for i, ratio in enumerate(ratios):
+                        series.append((first_bin + i + 0.5) / TONE_DEVIATION_RATE, (ratio - 1) * 100)
+            
+            position += count
+            if progress and not progress(100 * position / wav.frame_count):
+                break
+        
+        if speed_stats.count == 0:
+            raise ValueError("The reference tone was not found in the recording.")
+        
+        # No weighted value at all when the recording is shorter than the weighting filter
+        weighted_rms = math.sqrt(weighted_stats.m2 / weighted_stats.count + weighted_stats.mean ** 2) \
+            if weighted_stats.count else None
+        return {
+            'duration': wav.duration(),
+            'sample_rate': sample_rate,
+            'mean_hz': speed_stats.mean * self.reference_hz,
+            'speed_error': (speed_stats.mean - 1) * 100,
+            'wow_flutter_rms': weighted_rms * 100 if weighted_rms is not None else None,
+            'wow_flutter_2rms': 2 * weighted_rms * 100 if weighted_rms is not None else None,
+            'times': list(series.times),
+            'values': list(series.values),
         }
 
+class ToneSpeedDialog(AnalysisDialog):
+    # Dialog that measures speed and wow & flutter from a recorded test tone
+    def __init__(self, spec, on_apply_rpm=None, parent=None):
+        super().__init__(parent)
+        self.spec = spec
+        self.on_apply_rpm = on_apply_rpm
+        self.source_path = None
+        self.result = None
+        self.setWindowTitle("Speed and Wow & Flutter from Test Tone")
+        self.setMinimumSize(800, 600)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        
+        # Source selection
+        open_button = QPushButton("Open WAV...")
+        open_button.clicked.connect(self.choose_file)
+        main_layout.addWidget(open_button)
+        
+        self.source_label = QLabel("No file selected")
+        main_layout.addWidget(self.source_label)
+        
+        # Measurement parameters
+        params_layout = QHBoxLayout()
+        params_layout.addWidget(QLabel("Reference tone (Hz):"))
+        self.reference_input = QDoubleSpinBox()
+        self.reference_input.setRange(100, 20000)
+        self.reference_input.setDecimals(1)
+        self.reference_input.setValue(3150)
+        params_layout.addWidget(self.reference_input)
+        
+        params_layout.addWidget(QLabel("Nominal RPM:"))
+        self.nominal_rpm_input = QDoubleSpinBox()
+        self.nominal_rpm_input.setRange(1, 100)
+        self.nominal_rpm_input.setDecimals(2)
+        self.nominal_rpm_input.setValue(self.spec.rings[0].rpm if self.spec.rings else 33.33)
+        self.nominal_rpm_input.valueChanged.connect(self.update_suggestion)
+        params_layout.addWidget(self.nominal_rpm_input)
+        
+        self.run_button = QPushButton("Analyze")
+        self.run_button.setEnabled(False)
+        self.run_button.clicked.connect(self.run_analysis)
+        params_layout.addWidget(self.run_button)
+        main_layout.addLayout(params_layout)
+        
+        self.status_label = QLabel("")
+        main_layout.addWidget(self.status_label)
+        
+        # Chart and results
+        self.chart_widget = QSvgWidget()
+        self.chart_widget.setMinimumHeight(250)
+        main_layout.addWidget(self.chart_widget, 1)
+        
+        self.result_label = QLabel("")
+        main_layout.addWidget(self.result_label)
+        
+        # Suggested settings for a ring
+        apply_layout = QHBoxLayout()
+        apply_layout.addWidget(QLabel("Ring:"))
+        self.ring_combo = QComboBox()
+        self.ring_combo.addItems([f"Ring {i + 1}" for i in range(len(self.spec.rings))])
+        self.ring_combo.currentIndexChanged.connect(self.update_suggestion)
+        apply_layout.addWidget(self.ring_combo)
+        self.suggestion_label = QLabel("")
+        apply_layout.addWidget(self.suggestion_label, 1)
+        self.apply_button = QPushButton("Use as Manual RPM")
+        self.apply_button.setEnabled(False)
+        self.apply_button.clicked.connect(self.apply_rpm)
+        apply_layout.addWidget(self.apply_button)
+        main_layout.addLayout(apply_layout)
+    
+    def set_busy(self, busy):
+        self.run_button.setEnabled(not busy and self.source_path is not None)
+        self.apply_button.setEnabled(not busy and self.result is not None)
+    
+    def choose_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open WAV", "", "WAV Files (*.wav);;All Files (*)")
+        if file_path:
+            self.source_path = file_path
+            self.source_label.setText(file_path)
+            self.set_busy(False)
+    
+    def run_analysis(self):
+        self.result = None
+        self.suggestion_label.setText("")
+        analyzer = ToneSpeedAnalyzer(self.reference_input.value())
+        self.start_task(analyzer.run, self.source_path, on_finished=self.analysis_finished)
+    
+    def measured_rpm(self):
+        # Actual platter speed according to the measured speed error
+        return self.nominal_rpm_input.value() * (1 + self.result['speed_error'] / 100)
+    
+    def analysis_finished(self, result):
+        self.result = result
+        self.set_busy(False)
+        self.status_label.setText(f"Analyzed {result['duration']:.1f} s at {result['sample_rate']} Hz")
+        if result['wow_flutter_rms'] is None:
+            wow_flutter = f"Wow & flutter: recording too short (at least {TONE_WEIGHTING_SECONDS} s needed)"
+        else:
+            wow_flutter = (
+                f"Wow & flutter (IEC 60386 / DIN weighted): {result['wow_flutter_rms']:.3f}% RMS, "
+                f"±{result['wow_flutter_2rms']:.3f}% (2 × RMS)"
+            )
+        self.result_label.setText(
+            f"Average tone: {result['mean_hz']:.2f} Hz, speed error: {result['speed_error']:+.3f}%\n"
+            + wow_flutter
+        )
+        self.show_chart(render_series_chart_svg(
+            result['times'], result['values'], "Speed deviation", "s", "%", reference=0
+        ))
+        self.update_suggestion()
+    
+    def update_suggestion(self):
+        # Show the manual RPM and the line count a ring would use at the measured speed
+        if self.result is None or not self.spec.rings:
+            return
+        ring = self.spec.rings[self.ring_combo.currentIndex()]
+        rpm = round(self.measured_rpm(), 2)
+        lines_info = calculate_lines_for_ring(replace(ring, rpm=rpm), 100, ring.depth)
+        if lines_info['mode'] == 'single':
+            lines_text = f"{lines_info['num_lines']} lines"
+        else:
+            lines_text = f"{lines_info['outer_num_lines']}/{lines_info['inner_num_lines']} lines"
+        self.suggestion_label.setText(f"Suggested: {rpm:.2f} rpm, {lines_text} @ {ring.hz:g} Hz")
+    
+    def apply_rpm(self):
+        # Offer the measured speed back as the manual RPM of the selected ring
+        if self.result and self.on_apply_rpm:
+            self.on_apply_rpm(self.ring_combo.currentIndex(), round(self.measured_rpm(), 2))
+
+def render_thumbnail_png(svg, size=THUMBNAIL_SIZE):
+    # Rasterizes an SVG document to a small PNG image and returns its bytes
+    renderer = QSvgRenderer(QByteArray(svg.encode('utf-8')))
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    renderer.render(painter)
+    painter.end()
+    
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+class DesignLibrary:
+    # SQLite library of disc designs. The disc and ring parameters are stored in
+    # indexed columns for fast queries, the full spec as JSON, and small PNG
+    # thumbnails in a cache keyed by spec hash, so a design is only re-rendered
+    # when it changes.
+    def __init__(self, path=LIBRARY_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS designs (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                diameter REAL NOT NULL,
+                spindle_diameter REAL NOT NULL,
+                outer_circle_width REAL NOT NULL,
+                ring_separation REAL NOT NULL,
+                ring_count INTEGER NOT NULL,
+                spec_hash TEXT NOT NULL,
+                spec_json TEXT NOT NULL,
+                modified TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rings (
+                design_id INTEGER NOT NULL REFERENCES designs(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                rpm REAL NOT NULL,
+                hz REAL NOT NULL,
+                mode TEXT NOT NULL,
+                depth REAL NOT NULL,
+                PRIMARY KEY (design_id, position)
+            );
+            CREATE TABLE IF NOT EXISTS thumbnails (
+                spec_hash TEXT PRIMARY KEY,
+                png BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS designs_diameter ON designs(diameter);
+            CREATE INDEX IF NOT EXISTS designs_ring_count ON designs(ring_count);
+            CREATE INDEX IF NOT EXISTS designs_name ON designs(name);
+            CREATE INDEX IF NOT EXISTS rings_rpm_hz ON rings(rpm, hz);
+            CREATE INDEX IF NOT EXISTS rings_mode ON rings(mode);
+        """)
+        self.connection.commit()
+    
+    def close(self):
+        self.connection.close()
+    
+    def save(self, name, spec, thumbnail_png=None, design_id=None):
+        # Inserts a design, or replaces an existing one. Returns the design id.
+        spec_hash = spec.spec_hash()
+        values = (name, spec.diameter, spec.spindle_diameter, spec.outer_circle_width, spec.ring_separation,
+                  len(spec.rings), spec_hash, json.dumps(spec.to_dict()), datetime.now().isoformat(timespec='seconds'))
+        with self.connection:
+            if design_id is None:
+                cursor = self.connection.execute(
+                    "INSERT INTO designs (name, diameter, spindle_diameter, outer_circle_width, ring_separation, "
+                    "ring_count, spec_hash, spec_json, modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+                design_id = cursor.lastrowid
+            else:
+                self.connection.execute(
+                    "UPDATE designs SET name = ?, diameter = ?, spindle_diameter = ?, outer_circle_width = ?, "
+                    "ring_separation = ?, ring_count = ?, spec_hash = ?, spec_json = ?, modified = ? WHERE id = ?",
+                    values + (design_id,))
+                self.connection.execute("DELETE FROM rings WHERE design_id = ?", (design_id,))
+            
+            # Index every ring, with the mode it is actually drawn with
+            layout = layout_disc(spec)
+            self.connection.executemany(
+                "INSERT INTO rings (design_id, position, rpm, hz, mode, depth) VALUES (?, ?, ?, ?, ?, ?)",
+                [(design_id, position, ring_layout['ring'].rpm, ring_layout['ring'].hz,
+                  ring_layout['lines']['mode'], ring_layout['ring'].depth)
+                 for position, ring_layout in enumerate(layout['rings'])])
+            
+            if thumbnail_png is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails (spec_hash, png) VALUES (?, ?)", (spec_hash, thumbnail_png))
+            self.prune_thumbnails()
+        return design_id
+    
+    def load(self, design_id):
+        # Returns the name and spec of a design
+        row = self.connection.execute("SELECT name, spec_json FROM designs WHERE id = ?", (design_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"Design {design_id} not found in the library.")
+        return row[0], DiscSpec.from_dict(json.loads(row[1]))
+    
+    def delete(self, design_id):
+        with self.connection:
+            self.connection.execute("DELETE FROM designs WHERE id = ?", (design_id,))
+            self.prune_thumbnails()
+    
+    def find(self, name=None, rpm=None, hz=None, mode=None, max_diameter=None):
+        # Returns (id, name, diameter, ring_count, spec_hash) of the matching designs.
+        # The ring conditions must all hold for the same ring.
+        conditions = []
+        parameters = []
+        if name:
+            conditions.append("d.name LIKE ?")
+            parameters.append(f"%{name}%")
+        if max_diameter is not None:
+            conditions.append("d.diameter <= ?")
+            parameters.append(max_diameter)
+        
+        ring_conditions = []
+        if rpm is not None:
+            ring_conditions.append("r.rpm BETWEEN ? AND ?")
+            parameters.extend((rpm - LIBRARY_RPM_TOLERANCE, rpm + LIBRARY_RPM_TOLERANCE))
+        if hz is not None:
+            ring_conditions.append("r.hz = ?")
+            parameters.append(hz)
+        if mode is not None:
+            ring_conditions.append("r.mode = ?")
+            parameters.append(mode)
+        if ring_conditions:
+            # Uncorrelated, so the rings are looked up through the rpm/hz index
+            conditions.append("d.id IN (SELECT r.design_id FROM rings r WHERE "
+                              + " AND ".join(ring_conditions) + ")")
+        
+        query = "SELECT d.id, d.name, d.diameter, d.ring_count, d.spec_hash FROM designs d"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY d.name COLLATE NOCASE, d.id"
+        return self.connection.execute(query, parameters).fetchall()
+    
+    def thumbnail(self, spec_hash):
+        # Returns the cached PNG thumbnail of a spec, or None
+        row = self.connection.execute("SELECT png FROM thumbnails WHERE spec_hash = ?", (spec_hash,)).fetchone()
+        return row[0] if row else None
+    
+    def store_thumbnail(self, spec_hash, thumbnail_png):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO thumbnails (spec_hash, png) VALUES (?, ?)", (spec_hash, thumbnail_png))
+    
+    def prune_thumbnails(self):
+        # Drops thumbnails of specs no longer used by any design
+        self.connection.execute(
+            "DELETE FROM thumbnails WHERE spec_hash NOT IN (SELECT spec_hash FROM designs)")
+
+class DesignLibraryDialog(QDialog):
+    # Dialog to browse, search, open and delete the designs of the library
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.selected_spec = None
+        self.selected_name = None
+        self.selected_id = None
+        self.icons = {}  # Decoded thumbnails by spec hash, kept between searches
+        self.setWindowTitle("Design Library")
+        self.setMinimumSize(800, 600)
+        self.setup_ui()
+        self.search()
+    
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        
+        # Search once the filters stop changing, not on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.search)
+        
+        # Filters
+        filters_layout = QHBoxLayout()
+        filters_layout.addWidget(QLabel("Name:"))
+        self.name_input = QLineEdit()
+        self.name_input.textChanged.connect(self.schedule_search)
+        filters_layout.addWidget(self.name_input)
+        
+        filters_layout.addWidget(QLabel("RPM:"))
+        self.rpm_combo = QComboBox()
+        self.rpm_combo.setEditable(True)
+        self.rpm_combo.addItems(["Any", "16", "33.33", "45", "78"])
+        self.rpm_combo.currentTextChanged.connect(self.schedule_search)
+        filters_layout.addWidget(self.rpm_combo)
+        
+        filters_layout.addWidget(QLabel("Hz:"))
+        self.hz_combo = QComboBox()
+        self.hz_combo.addItems(["Any", "50", "60"])
+        self.hz_combo.currentTextChanged.connect(self.schedule_search)
+        filters_layout.addWidget(self.hz_combo)
+        
+        filters_layout.addWidget(QLabel("Mode:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Any", "single", "double"])
+        self.mode_combo.currentTextChanged.connect(self.schedule_search)
+        filters_layout.addWidget(self.mode_combo)
+        
+        filters_layout.addWidget(QLabel("Max diameter:"))
+        self.max_diameter_input = QSpinBox()
+        self.max_diameter_input.setRange(0, 320)
+        self.max_diameter_input.setSpecialValueText("Any")
+        self.max_diameter_input.valueChanged.connect(self.schedule_search)
+        filters_layout.addWidget(self.max_diameter_input)
+        main_layout.addLayout(filters_layout)
+        
+        # Designs
+        self.designs_list = QListWidget()
+        self.designs_list.setViewMode(QListWidget.ViewMode.IconMode)
+        self.designs_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.designs_list.setResizeMode(QListWidget.ResizeMode.Adjust)
+        self.designs_list.setUniformItemSizes(True)
+        self.designs_list.setWordWrap(True)
+        self.designs_list.itemDoubleClicked.connect(self.open_selected)
+        main_layout.addWidget(self.designs_list, 1)
+        
+        self.count_label = QLabel("")
+        main_layout.addWidget(self.count_label)
+        
+        buttons_layout = QHBoxLayout()
+        delete_button = QPushButton("Delete")
+        delete_button.clicked.connect(self.delete_selected)
+        open_button = QPushButton("Open")
+        open_button.clicked.connect(self.open_selected)
+        buttons_layout.addWidget(delete_button)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(open_button)
+        main_layout.addLayout(buttons_layout)
+    
+    def schedule_search(self):
+        self.search_timer.start(LIBRARY_SEARCH_DELAY)
+    
+    def search(self):
+        # Refresh the list with the designs matching the filters
+        self.search_timer.stop()
+        rpm_text = self.rpm_combo.currentText()
+        try:
+            rpm = None if rpm_text in ("", "Any") else float(rpm_text)
+        except ValueError:
+            return  # Incomplete value while typing
+        hz_text = self.hz_combo.currentText()
+        mode_text = self.mode_combo.currentText()
+        max_diameter = self.max_diameter_input.value()
+        
+        rows = self.library.find(
+            name=self.name_input.text().strip() or None,
+            rpm=rpm,
+            hz=None if hz_text == "Any" else float(hz_text),
+            mode=None if mode_text == "Any" else mode_text,
+            max_diameter=max_diameter or None,
+        )
+        
+        self.designs_list.clear()
+        for design_id, name, diameter, ring_count, spec_hash in rows:
+            item = QListWidgetItem(f"{name}\n{diameter:g} mm, {ring_count} rings")
+            item.setData(Qt.ItemDataRole.UserRole, design_id)
+            icon = self.icons.get(spec_hash)
+            if icon is None:
+                icon = self.icons[spec_hash] = QIcon(self.thumbnail_pixmap(design_id, spec_hash))
+            item.setIcon(icon)
+            self.designs_list.addItem(item)
+        self.count_label.setText(f"{len(rows)} designs")
+    
+    def thumbnail_pixmap(self, design_id, spec_hash):
+        # Thumbnail from the cache, rendered only if missing
+        png = self.library.thumbnail(spec_hash)
+        if png is None:
+            name, spec = self.library.load(design_id)
+            png = render_thumbnail_png(render_disc_svg(spec))
+            self.library.store_thumbnail(spec_hash, png)
+        pixmap = QPixmap()
+        pixmap.loadFromData(png, "PNG")
+        return pixmap
+    
+    def current_design_id(self):
+        item = self.designs_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+    
+    def open_selected(self):
+        design_id = self.current_design_id()
+        if design_id is None:
+            return
+        self.selected_name, self.selected_spec = self.library.load(design_id)
+        self.selected_id = design_id
+        self.accept()
+    
+    def delete_selected(self):
+        design_id = self.current_design_id()
+        if design_id is None:
+            return
+        reply = QMessageBox.question(
+            self, "Confirmation", "Do you want to delete the selected design?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.library.delete(design_id)
+            self.search()
+
+def calibration_ring_capacity(base_spec, depth, separation):
+    # Number of rings of the given depth that fit between the outer circle and
+    # the spindle (or CALIBRATION_MIN_RADIUS) of a disc
+    outer_radius = base_spec.diameter / 2 - (base_spec.outer_circle_width if base_spec.outer_circle_width > 0 else 0)
+    inner_limit = max(base_spec.spindle_diameter / 2, CALIBRATION_MIN_RADIUS)
+    return max(int(math.floor((outer_radius - inner_limit + separation) / (depth + separation) + 1e-9)), 0)
+
+def build_calibration_sheets(base_spec, rpm_start, rpm_end, rpm_step, hz_values, depth, separation,
+                             single_mode=True, labels=True):
+    # Builds the discs of a calibration sheet: one ring per (rpm, hz) of the
+    # range, spread across as many discs as needed. Line counts are integers, so
+    # neighbouring speeds often give the same lines: those share a single ring,
+    # labelled with the speed at which its lines actually stand still. Rings
+    # whose still speed falls outside the range are left out.
+    # Returns a list of DiscSpec.
+    rpm_values = np.round(np.arange(rpm_start, rpm_end + rpm_step / 2, rpm_step), 4)
+    sweep_count = len(rpm_values) * len(hz_values)
+    if sweep_count > CALIBRATION_MAX_SWEEP:
+        raise ValueError(
+            f"The range has {sweep_count} speed and frequency pairs, the maximum is {CALIBRATION_MAX_SWEEP}. "
+            "Use a larger step."
+        )
+    
+    capacity = calibration_ring_capacity(base_spec, depth, separation)
+    if capacity < 1:
+        raise ValueError("No ring of this depth fits on the disc.")
+    
+    rings = []
+    patterns = set()
+    for rpm in rpm_values.tolist():
+        for hz in hz_values:
+            ring = RingSpec(rpm=rpm, hz=hz, depth=depth, single_mode=single_mode, manual_rpm=True)
+            lines_info = calculate_lines_for_ring(ring, 1, 0)  # Line counts do not depend on the radius
+            if lines_info['mode'] == 'single':
+                line_counts = (lines_info['num_lines'],)
+            else:
+                line_counts = (lines_info['outer_num_lines'], lines_info['inner_num_lines'])
+            if (hz, line_counts) in patterns:
+                continue
+            patterns.add((hz, line_counts))
+            still_speeds = [round(120 * hz / num_lines, 3) for num_lines in line_counts]
+            if min(still_speeds) < rpm_start - 0.0005 or max(still_speeds) > rpm_end + 0.0005:
+                continue
+            still_rpm = "/".join(f"{still:.3f}" for still in still_speeds)
+            rings.append(replace(
+                ring,
+                label=f"{still_rpm} rpm {hz:g} Hz",
+                label_style="straight" if labels else "none",
+            ))
+    
+    if not rings:
+        raise ValueError("The RPM range and the frequencies do not produce any ring.")
+    if len(rings) > CALIBRATION_MAX_RINGS:
+        raise ValueError(f"The sheet would have {len(rings)} rings, the maximum is {CALIBRATION_MAX_RINGS}.")
+    
+    return [
+        replace(base_spec, ring_separation=separation, rings=tuple(rings[start:start + capacity]))
+        for start in range(0, len(rings), capacity)
+    ]
+
+def render_discs_svg(specs, progress=None):
+    # Renders several discs in parallel worker processes, one disc per batch
+    svgs = []
+    workers = min(len(specs), os.cpu_count() or 1)
+    if workers <= 1:
+        for spec in specs:
+            svgs.append(render_disc_svg(spec))
+            if progress and not progress(100 * len(svgs) / len(specs)):
+                break
+        return svgs
+    
+    # Fill the glyph cache here, the workers have no Qt application to extract outlines
+    for spec in specs:
+        for ring_layout in layout_disc(spec)['rings']:
+            label_layout(ring_layout, GLYPH_CACHE)
+    
+    context = multiprocessing.get_context('spawn')  # Forking a process that runs Qt is not safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        for svg in executor.map(render_disc_svg, specs, repeat(GLYPH_CACHE)):
+            svgs.append(svg)
+            if progress and not progress(100 * len(svgs) / len(specs)):
+                executor.shutdown(cancel_futures=True)
+                break
+    return svgs
+
+class CalibrationSheetDialog(AnalysisDialog):
+    # Dialog that generates discs with many narrow rings at finely graded speeds
+    def __init__(self, base_spec, paper_format="A4", parent=None):
+        super().__init__(parent)
+        self.base_spec = base_spec
+        self.paper_format = paper_format
+        self.specs = []
+        self.svgs = []
+        self.generate_started = 0
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.setWindowTitle("Calibration Sheet")
+        self.setMinimumSize(800, 700)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        main_layout = QHBoxLayout(self)
+        
+        # Controls
+        controls_layout = QVBoxLayout()
+        controls_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        
+        def add_spin_box(label, minimum, maximum, value, decimals, step):
+            layout = QHBoxLayout()
+            layout.addWidget(QLabel(label))
+            spin_box = QDoubleSpinBox()
+            spin_box.setRange(minimum, maximum)
+            spin_box.setDecimals(decimals)
+            spin_box.setSingleStep(step)
+            spin_box.setValue(value)
+            layout.addWidget(spin_box)
+            controls_layout.addLayout(layout)
+            return spin_box
+        
+        self.rpm_start_input = add_spin_box("RPM from:", 1, 100, 33, 2, 0.01)
+        self.rpm_end_input = add_spin_box("RPM to:", 1, 100, 34, 2, 0.01)
+        self.rpm_step_input = add_spin_box("RPM step:", 0.01, 10, 0.01, 2, 0.01)
+        self.depth_input = add_spin_box("Ring depth (mm):", 0.5, 20, 1.5, 2, 0.1)
+        self.separation_input = add_spin_box("Ring separation (mm):", 0, 10, 0.3, 2, 0.1)
+        
+        self.hz_50_check = QCheckBox("50 Hz")
+        self.hz_50_check.setChecked(True)
+        self.hz_60_check = QCheckBox("60 Hz")
+        self.hz_60_check.setChecked(True)
+        controls_layout.addWidget(self.hz_50_check)
+        controls_layout.addWidget(self.hz_60_check)
+        
+        self.single_mode_check = QCheckBox("Single mode")
+        self.single_mode_check.setChecked(True)
+        controls_layout.addWidget(self.single_mode_check)
+        
+        self.labels_check = QCheckBox("Label each ring")
+        self.labels_check.setChecked(True)
+        controls_layout.addWidget(self.labels_check)
+        
+        self.generate_button = QPushButton("Generate")
+        self.generate_button.clicked.connect(self.generate)
+        controls_layout.addWidget(self.generate_button)
+        
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        controls_layout.addWidget(self.status_label)
+        
+        # Page selection
+        page_layout = QHBoxLayout()
+        page_layout.addWidget(QLabel("Disc:"))
+        self.page_input = QSpinBox()
+        self.page_input.setRange(1, 1)
+        self.page_input.valueChanged.connect(self.show_page)
+        page_layout.addWidget(self.page_input)
+        controls_layout.addLayout(page_layout)
+        
+        self.export_button = QPushButton("Export")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(self.export)
+        controls_layout.addWidget(self.export_button)
+        
+        main_layout.addLayout(controls_layout, 1)
+        
+        # Preview
+        self.chart_widget = QSvgWidget()
+        self.chart_widget.setMinimumSize(QSize(400, 400))
+        main_layout.addWidget(self.chart_widget, 2)
+    
+    def set_busy(self, busy):
+        self.generate_button.setEnabled(not busy)
+        self.export_button.setEnabled(not busy and bool(self.svgs))
+    
+    def generate(self):
+        hz_values = [hz for hz, check in ((50.0, self.hz_50_check), (60.0, self.hz_60_check)) if check.isChecked()]
+        try:
+            self.specs = build_calibration_sheets(
+                self.base_spec,
+                self.rpm_start_input.value(),
+                self.rpm_end_input.value(),
+                self.rpm_step_input.value(),
+                hz_values,
+                self.depth_input.value(),
+                self.separation_input.value(),
+                single_mode=self.single_mode_check.isChecked(),
+                labels=self.labels_check.isChecked(),
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Warning", str(e))
+            return
+        self.svgs = []
+        self.generate_started = time.monotonic()
+        self.start_task(render_discs_svg, self.specs, on_finished=self.generation_finished)
+    
+    def generation_finished(self, svgs):
+        self.svgs = svgs
+        self.set_busy(False)
+        ring_count = sum(len(spec.rings) for spec in self.specs)
+        self.status_label.setText(
+            f"{ring_count} rings on {len(self.specs)} discs in {time.monotonic() - self.generate_started:.1f} s "
+            f"(speeds that give the same lines share a ring)"
+        )
+        self.page_input.setRange(1, max(len(self.svgs), 1))
+        self.page_input.setValue(1)
+        self.show_page()
+    
+    def show_page(self):
+        index = self.page_input.value() - 1
+        if index < len(self.svgs):
+            self.chart_widget.load(QByteArray(self.svgs[index].encode('utf-8')))
+    
+    def export(self):
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Calibration Sheet", "", "PDF Files (*.pdf);;SVG Files (*.svg)"
+        )
+        if not file_path:
+            return
+        try:
+            if selected_filter.startswith("SVG"):
+                # One SVG file per disc
+                base, _ = os.path.splitext(file_path)
+                for i, svg in enumerate(self.svgs):
+                    with open(f"{base}_{i + 1}.svg", 'w') as f:
+                        f.write(svg)
+                saved = f"{base}_1.svg ... {base}_{len(self.svgs)}.svg"
+            else:
+                # One PDF page per disc
+                if not file_path.endswith(".pdf"):
+                    file_path += ".pdf"
+                pagesize = PAPER_SIZES.get(self.paper_format, A4)
+                pdf = pdf_canvas.Canvas(file_path, pagesize=pagesize)
+                for i, (spec, svg) in enumerate(zip(self.specs, self.svgs)):
+                    svg_path = os.path.join(self.temp_dir.name, f"disc_{i + 1}.svg")
+                    with open(svg_path, 'w') as f:
+                        f.write(svg)
+                    renderPDF.draw(build_pdf_page_drawing(svg_path, spec.diameter, pagesize), pdf, 0, 0)
+                    pdf.showPage()
+                pdf.save()
+                saved = file_path
+            QMessageBox.information(self, "Success", f"File saved successfully to {saved}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error saving file: {e}")
+    
+    def done(self, result):
+        super().done(result)
+        self.temp_dir.cleanup()
+
 class StroboscopeMultiRingsGenerator(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -272,6 +2866,18 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         # List to store ring widgets
         self.ring_widgets = []
         
+        # Undo/redo history and cache of rendered previews
+        self.history = SpecHistory()
+        self.preview_cache = PreviewCache()
+        
+        # Validation of the last exported PostScript file, run in the background
+        self.validation_task = None
+        
+        # Design library, opened on first use, and the design loaded from it
+        self.library = None
+        self.library_design_id = None
+        self.library_design_name = ""
+        
         # Timer to delay the preview update
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
@@ -344,6 +2950,24 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         controls_layout = QVBoxLayout(controls_panel)
         controls_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
+        # Undo / Redo
+        history_layout = QHBoxLayout()
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.setEnabled(False)
+        self.undo_button.clicked.connect(self.undo)
+        self.redo_button = QPushButton("Redo")
+        self.redo_button.setEnabled(False)
+        self.redo_button.clicked.connect(self.redo)
+        history_layout.addWidget(self.undo_button)
+        history_layout.addWidget(self.redo_button)
+        controls_layout.addLayout(history_layout)
+        
+        QShortcut(QKeySequence.StandardKey.Undo, self, self.undo)
+        QShortcut(QKeySequence.StandardKey.Redo, self, self.redo)
+        # Spin boxes and line edits claim Ctrl+Z for their own text undo: take
+        # it back, so the shortcuts always go through the design history
+        QApplication.instance().installEventFilter(self)
+        
         # Disc Parameters Group
         params_group = QGroupBox("Disc Parameters (in mm)")
         self.apply_font_to_widget(params_group, 1)  # Group title slightly larger
@@ -457,13 +3081,17 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         self.format_group = QButtonGroup()
         self.svg_radio = QRadioButton("SVG")
         self.pdf_radio = QRadioButton("PDF")
+        self.eps_radio = QRadioButton("EPS/PS")
+        self.eps_radio.setToolTip("Compact PostScript: each ring is drawn by a loop, whatever its number of lines")
         self.svg_radio.setChecked(True)  # SVG by default
         self.format_group.addButton(self.svg_radio)
         self.format_group.addButton(self.pdf_radio)
+        self.format_group.addButton(self.eps_radio)
         
         export_format_layout.addWidget(export_format_label)
         export_format_layout.addWidget(self.svg_radio)
         export_format_layout.addWidget(self.pdf_radio)
+        export_format_layout.addWidget(self.eps_radio)
         export_layout.addLayout(export_format_layout)
         
         # Paper format selection (for PDF export)
@@ -472,14 +3100,15 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         self.paper_format_combo = QComboBox()
         self.paper_format_combo.addItems(["A4", "Letter", "Legal", "A3"])
         self.paper_format_combo.setCurrentIndex(0)  # A4 by default
-        self.paper_format_combo.setEnabled(False)  # Disabled by default (enabled only when PDF is selected)
+        self.paper_format_combo.setEnabled(False)  # Disabled by default (enabled only when PDF or PS is selected)
         
         self.paper_format_layout.addWidget(paper_format_label)
         self.paper_format_layout.addWidget(self.paper_format_combo)
         export_layout.addLayout(self.paper_format_layout)
         
         # Connect radio buttons to enable/disable paper format selection
-        self.pdf_radio.toggled.connect(lambda checked: self.paper_format_combo.setEnabled(checked))
+        self.pdf_radio.toggled.connect(self.update_paper_format_enabled)
+        self.eps_radio.toggled.connect(self.update_paper_format_enabled)
         
         self.export_button = QPushButton("Export")
         self.apply_font_to_widget(self.export_button, 1)
@@ -487,9 +3116,54 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         self.export_button.setEnabled(False)
         export_layout.addWidget(self.export_button)
         
+        # Calibration sheet
+        self.calibration_button = QPushButton("Calibration Sheet")
+        self.calibration_button.setToolTip("Generate discs with many narrow rings at finely graded speeds")
+        self.calibration_button.clicked.connect(self.open_calibration_sheet)
+        export_layout.addWidget(self.calibration_button)
+        
         export_group.setLayout(export_layout)
         controls_layout.addWidget(export_group)
         
+        # Library Group
+        library_group = QGroupBox("Design Library")
+        self.apply_font_to_widget(library_group, 1)
+        library_layout = QHBoxLayout()
+        
+        self.save_library_button = QPushButton("Save to Library")
+        self.save_library_button.clicked.connect(self.save_to_library)
+        library_layout.addWidget(self.save_library_button)
+        
+        self.open_library_button = QPushButton("Open Library")
+        self.open_library_button.clicked.connect(self.open_library)
+        library_layout.addWidget(self.open_library_button)
+        
+        library_group.setLayout(library_layout)
+        controls_layout.addWidget(library_group)
+        
+        # Analysis Group
+        analysis_group = QGroupBox("Analysis")
+        self.apply_font_to_widget(analysis_group, 1)
+        analysis_layout = QVBoxLayout()
+        
+        self.drift_analysis_button = QPushButton("Mains Drift Analysis")
+        self.drift_analysis_button.setToolTip("Sweep the apparent drift of every ring over speed and mains frequency")
+        self.drift_analysis_button.clicked.connect(self.open_drift_analysis)
+        analysis_layout.addWidget(self.drift_analysis_button)
+        
+        self.video_speed_button = QPushButton("Speed From Video")
+        self.video_speed_button.setToolTip("Measure the platter speed from a video of a disc made with the current design")
+        self.video_speed_button.clicked.connect(self.open_video_speed)
+        analysis_layout.addWidget(self.video_speed_button)
+        
+        self.tone_speed_button = QPushButton("Speed From Test Tone")
+        self.tone_speed_button.setToolTip("Measure speed and wow & flutter from a recorded test tone (WAV)")
+        self.tone_speed_button.clicked.connect(self.open_tone_speed)
+        analysis_layout.addWidget(self.tone_speed_button)
+        
+        analysis_group.setLayout(analysis_layout)
+        controls_layout.addWidget(analysis_group)
+        
         # Add control panel to main layout
         main_layout.addWidget(controls_panel, 1)
         
@@ -557,55 +3231,53 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         # Update the preview
         self.schedule_preview_update()
     
-    def calculate_lines_for_ring(self, ring_widget, radius, ring_depth):
-        # Calculate the number of lines and line width for a ring
-        settings = ring_widget.get_settings()
-        rpm = settings['rpm']
-        hz = settings['hz']
-        single_mode = settings['single_mode']
-        
-        # Update the ring widget's calculated information
-        ring_widget.update_segments_info(radius)
-        
-        # Calculate the exact number of lines
-        num_lines_exact = (60 * hz) / rpm * 2
-        
-        # Calculate floor and ceiling number of lines
-        num_lines_floor = math.floor(num_lines_exact)
-        num_lines_ceil = math.ceil(num_lines_exact)
-        
-        # Determine if we're using single or double mode
-        if num_lines_floor == num_lines_ceil or single_mode:
-            if num_lines_floor == num_lines_ceil:
-                num_lines = num_lines_floor
-            else:
-                num_lines = round(num_lines_exact)
-            
-            # Calculate line width
-            circumference = 2 * math.pi * radius
-            line_width = circumference / (num_lines * 2)  # Half the segment width
-            
-            return {
-                'mode': 'single',
-                'num_lines': num_lines,
-                'line_width': line_width
-            }
-        else:
-            # Double mode
-            # Calculate line widths for both sets
-            outer_circumference = 2 * math.pi * radius
-            inner_circumference = 2 * math.pi * (radius - ring_depth)
-            
-            outer_line_width = outer_circumference / (num_lines_floor * 2)
-            inner_line_width = inner_circumference / (num_lines_ceil * 2)
-            
-            return {
-                'mode': 'double',
-                'outer_num_lines': num_lines_floor,
-                'outer_line_width': outer_line_width,
-                'inner_num_lines': num_lines_ceil,
-                'inner_line_width': inner_line_width
-            }
+    def capture_spec(self):
+        # Builds an immutable snapshot of the current design, reusing the ring
+        # specs of the current snapshot that did not change
+        previous = self.history.current()
+        previous_rings = previous.rings if previous else ()
+        
+        rings = []
+        for i, ring_widget in enumerate(self.ring_widgets):
+            ring = RingSpec.from_settings(ring_widget.get_settings())
+            if i < len(previous_rings) and previous_rings[i] == ring:
+                ring = previous_rings[i]
+            rings.append(ring)
+        rings = tuple(rings)
+        if rings == previous_rings:
+            rings = previous_rings
+        
+        return DiscSpec(
+            diameter=self.diameter_input.value(),
+            spindle_diameter=self.spindle_diameter_input.value(),
+            outer_circle_width=self.outer_circle_width_input.value(),
+            ring_separation=self.ring_separation_input.value(),
+            rings=rings,
+        )
+    
+    def apply_spec(self, spec):
+        # Restores the widgets from a snapshot without recording a new history step
+        for widget, value in (
+            (self.diameter_input, int(spec.diameter)),
+            (self.spindle_diameter_input, spec.spindle_diameter),
+            (self.outer_circle_width_input, spec.outer_circle_width),
+            (self.ring_separation_input, spec.ring_separation),
+        ):
+            widget.blockSignals(True)
+            widget.setValue(value)
+            widget.blockSignals(False)
+        
+        # Match the number of ring widgets
+        while len(self.ring_widgets) > len(spec.rings):
+            self.delete_ring(len(self.ring_widgets) - 1)
+        while len(self.ring_widgets) < len(spec.rings):
+            self.add_ring()
+        
+        for ring_widget, ring in zip(self.ring_widgets, spec.rings):
+            ring_widget.set_settings(ring.to_settings())
+        
+        # Changes made here must not trigger a new preview
+        self.update_timer.stop()
     
     def generate_disc(self):
         # Generates the multi-ring stroboscopic disc SVG.
@@ -614,134 +3286,148 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please add at least one ring.")
             return
         
-        # Input parameters
-        diameter = self.diameter_input.value()
-        spindle_diameter = self.spindle_diameter_input.value()
-        outer_circle_width = self.outer_circle_width_input.value()
-        
-        ring_separation = self.ring_separation_input.value()
-        
-        # SVG temp file path
-        self.temp_svg_file = tempfile.NamedTemporaryFile(suffix=".svg", delete=False)
-        self.temp_svg_file.close()
-        
-        dwg = svgwrite.Drawing(
-            self.temp_svg_file.name,
-            size=(f"{diameter}mm", f"{diameter}mm"),
-            profile="tiny",
-            viewBox=f"0 0 {diameter} {diameter}",
-        )
-        
-        center = (diameter / 2, diameter / 2)
-        
-        # Draw Outer Circle
-        disc_radius = diameter / 2 - (outer_circle_width / 2 if outer_circle_width > 0 else 0)
-        
-        if outer_circle_width > 0:
-            dwg.add(dwg.circle(
-                center=center, 
-                r=disc_radius, 
-                fill='none', 
-                stroke='black', 
-                stroke_width=outer_circle_width
-            ))
-            
-        current_radius = disc_radius - (outer_circle_width / 2 if outer_circle_width > 0 else 0)
-        
-        # Get settings for all rings
-        ring_widgets = self.ring_widgets.copy()
-        
-        # Draw each ring from outside to inside
-        for i, ring_widget in enumerate(ring_widgets):
-            settings = ring_widget.get_settings()
-            ring_depth = settings['depth']
-            
-            # Calculate inner radius for this ring
-            inner_radius = current_radius - ring_depth
-            
-            # Ensure inner radius is not smaller than the spindle radius
-            if inner_radius < spindle_diameter / 2:
-                inner_radius = spindle_diameter / 2
-                ring_depth = current_radius - inner_radius
-            
-            # Calculate lines for this ring
-            lines_info = self.calculate_lines_for_ring(ring_widget, current_radius, ring_depth)
-            
-            if lines_info['mode'] == 'single':
-                # Draw single set of lines
-                num_lines = lines_info['num_lines']
-                line_width = lines_info['line_width']
-                
-                angle_increment = 360 / num_lines # Degrees between each line
-                
-                for j in range(num_lines):
-                    angle = math.radians(j * angle_increment)
-                    # Outer endpoint of the line (x1, y1)
-                    x1 = center[0] + current_radius * math.sin(angle)
-                    y1 = center[1] - (current_radius * math.cos(angle))
-                    
-                    # Inner endpoint of the line (x2, y2)
-                    x2 = center[0] + inner_radius * math.sin(angle)
-                    y2 = center[1] - (inner_radius * math.cos(angle))
-                    
-                    dwg.add(dwg.line((x1, y1), (x2, y2), stroke=svgwrite.rgb(0, 0, 0, "%"), stroke_width=line_width))
-            else:
-                # Draw double set of lines
-                # Outer set
-                outer_num_lines = lines_info['outer_num_lines']
-                outer_line_width = lines_info['outer_line_width']
-                
-                angle_increment_outer = 360 / outer_num_lines
-                
-                for j in range(outer_num_lines):
-                    angle = math.radians(j * angle_increment_outer)
-                    # Outer endpoint of the line (x1, y1)
-                    x1 = center[0] + current_radius * math.sin(angle)
-                    y1 = center[1] - (current_radius * math.cos(angle))
-                    
-                    # Inner endpoint of the line (x2, y2)
-                    mid_radius = current_radius - ring_depth / 2
-                    x2 = center[0] + mid_radius * math.sin(angle)
-                    y2 = center[1] - (mid_radius * math.cos(angle))
-                    
-                    dwg.add(dwg.line((x1, y1), (x2, y2), stroke=svgwrite.rgb(0, 0, 0, "%"), stroke_width=outer_line_width))
-                
-                # Inner set
-                inner_num_lines = lines_info['inner_num_lines']
-                inner_line_width = lines_info['inner_line_width']
-                
-                angle_increment_inner = 360 / inner_num_lines
-                
-                for j in range(inner_num_lines):
-                    angle = math.radians(j * angle_increment_inner)
-                    # Outer endpoint of the line (x1, y1)
-                    mid_radius = current_radius - ring_depth / 2
-                    x1 = center[0] + mid_radius * math.sin(angle)
-                    y1 = center[1] - (mid_radius * math.cos(angle))
-                    
-                    # Inner endpoint of the line (x2, y2)
-                    x2 = center[0] + inner_radius * math.sin(angle)
-                    y2 = center[1] - (inner_radius * math.cos(angle))
-                    
-                    dwg.add(dwg.line((x1, y1), (x2, y2), stroke=svgwrite.rgb(0, 0, 0, "%"), stroke_width=inner_line_width))
-            
-            # Update current radius for the next ring, applying separation
-            current_radius = inner_radius - ring_separation
-        
-        # Draw Spindle Hole
-        dwg.add(dwg.circle(
-            center=center, 
-            r=spindle_diameter/2, 
-            fill='black', 
-            stroke='black', 
-            stroke_width=0.2
-        ))
-        
-        # Save and Display
-        dwg.save()
-        self.svg_widget.load(self.temp_svg_file.name)
+        spec = self.capture_spec()
+        self.history.push(spec)
+        self.show_spec(spec)
+    
+    def show_spec(self, spec):
+        # Displays the preview of a spec, rendering it only if it is not cached
+        svg = self.preview_cache.get(spec)
+        if svg is None:
+            svg = render_disc_svg(spec)
+            self.preview_cache.put(spec, svg)
+        self.svg_content = svg
+        
+        # Update the ring widgets' calculated information
+        for ring_widget, ring_layout in zip(self.ring_widgets, layout_disc(spec)['rings']):
+            ring_widget.update_segments_info(ring_layout['outer_radius'])
+        
+        # SVG temp file used by the export
+        if not self.temp_svg_file:
+            self.temp_svg_file = tempfile.NamedTemporaryFile(suffix=".svg", dir=self.temp_dir.name, delete=False)
+            self.temp_svg_file.close()
+        with open(self.temp_svg_file.name, 'w') as f:
+            f.write(svg)
+        
+        # Display
+        self.svg_widget.load(QByteArray(svg.encode('utf-8')))
         self.adjust_svg_size()
         self.export_button.setEnabled(True)
+        self.update_history_buttons()
+    
+    def update_history_buttons(self):
+        # Enable the undo/redo buttons according to the history
+        self.undo_button.setEnabled(self.history.can_undo())
+        self.redo_button.setEnabled(self.history.can_redo())
+    
+    def flush_pending_edit(self):
+        # Records an edit still waiting for its preview delay, so undo and redo
+        # start from what is on screen
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self.generate_disc()
+    
+    def undo(self):
+        # Go back to the previous snapshot
+        self.flush_pending_edit()
+        spec = self.history.undo()
+        if spec is not None:
+            self.apply_spec(spec)
+            self.show_spec(spec)
+    
+    def redo(self):
+        # Go forward to the next snapshot
+        self.flush_pending_edit()
+        spec = self.history.redo()
+        if spec is not None:
+            self.apply_spec(spec)
+            self.show_spec(spec)
+    
+    def open_drift_analysis(self):
+        # Open the mains frequency drift analysis for the current rings
+        if not self.ring_widgets:
+            QMessageBox.warning(self, "Warning", "Please add at least one ring.")
+            return
+        rings = []
+        for ring_widget in self.ring_widgets:
+            settings = ring_widget.get_settings()
+            rings.append({
+                'rpm': settings['rpm'],
+                'hz': settings['hz'],
+                'line_counts': ring_widget.get_line_counts(),
+            })
+        dialog = DriftAnalysisDialog(rings, parent=self)
+        dialog.exec()
+    
+    def open_video_speed(self):
+        # Open the speed measurement from a video of the current design
+        if not self.ring_widgets:
+            QMessageBox.warning(self, "Warning", "Please add at least one ring.")
+            return
+        dialog = VideoSpeedDialog(self.capture_spec(), on_apply_rpm=self.apply_manual_rpm, parent=self)
+        dialog.exec()
+    
+    def open_tone_speed(self):
+        # Open the speed and wow & flutter measurement from a test tone recording
+        if not self.ring_widgets:
+            QMessageBox.warning(self, "Warning", "Please add at least one ring.")
+            return
+        dialog = ToneSpeedDialog(self.capture_spec(), on_apply_rpm=self.apply_manual_rpm, parent=self)
+        dialog.exec()
+    
+    def apply_manual_rpm(self, index, rpm):
+        # Set a measured speed as the manual RPM of a ring
+        if index < len(self.ring_widgets):
+            self.ring_widgets[index].set_manual_rpm(rpm)
+    
+    def open_calibration_sheet(self):
+        # Open the calibration sheet generator using the current disc parameters
+        base_spec = replace(self.capture_spec(), rings=())
+        dialog = CalibrationSheetDialog(base_spec, self.paper_format_combo.currentText(), parent=self)
+        dialog.exec()
+    
+    def get_library(self):
+        # Opens the design library on first use
+        if self.library is None:
+            self.library = DesignLibrary()
+        return self.library
+    
+    def save_to_library(self):
+        # Save the current design in the library
+        if not self.ring_widgets:
+            QMessageBox.warning(self, "Warning", "Please add at least one ring.")
+            return
+        name, ok = QInputDialog.getText(self, "Save to Library", "Design name:", text=self.library_design_name)
+        if not ok or not name.strip():
+            return
+        try:
+            spec = self.capture_spec()
+            svg = self.preview_cache.get(spec) or render_disc_svg(spec)
+            library = self.get_library()
+            
+            # Replace the design that was opened if the name is kept, otherwise add a new one
+            design_id = self.library_design_id if name.strip() == self.library_design_name else None
+            self.library_design_id = library.save(name.strip(), spec, render_thumbnail_png(svg), design_id)
+            self.library_design_name = name.strip()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error saving the design: {e}")
+    
+    def open_library(self):
+        # Browse the library and load the chosen design
+        try:
+            dialog = DesignLibraryDialog(self.get_library(), parent=self)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error opening the library: {e}")
+            return
+        if dialog.exec() and dialog.selected_spec is not None:
+            self.library_design_id = dialog.selected_id
+            self.library_design_name = dialog.selected_name
+            self.apply_spec(dialog.selected_spec)
+            self.generate_disc()
+    
+    def update_paper_format_enabled(self):
+        # The paper format applies to the PDF and PS exports
+        self.paper_format_combo.setEnabled(self.pdf_radio.isChecked() or self.eps_radio.isChecked())
     
     def export_file(self):
         try:
@@ -753,17 +3439,23 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
             if self.svg_radio.isChecked():
                 file_filter = "SVG Files (*.svg)"
                 default_ext = ".svg"
-            else:
-                # PDF selected
+            elif self.pdf_radio.isChecked():
                 file_filter = "PDF Files (*.pdf)"
                 default_ext = ".pdf"
+            else:
+                # EPS/PS selected, the paper format only applies to PS
+                file_filter = "EPS Files (*.eps);;PostScript Files (*.ps)"
+                default_ext = ".eps"
         
-            file_path, _ = QFileDialog.getSaveFileName(
+            file_path, selected_filter = QFileDialog.getSaveFileName(
                 self, "Export Multi-Ring Stroboscopic Disc", "", file_filter
             )
         
             if not file_path:
                 return
+            
+            if self.eps_radio.isChecked() and (selected_filter.startswith("PostScript") or file_path.endswith(".ps")):
+                default_ext = ".ps"
         
             # If the user did not add the extension, add it
             if not file_path.endswith(default_ext):
@@ -782,50 +3474,21 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
                 # Save as SVG (copy the temporary file)
                 with open(self.temp_svg_file.name, 'r') as src, open(file_path, 'w') as dst:
                     dst.write(src.read())
+            elif self.eps_radio.isChecked():
+                # Save as EPS or PS, drawn procedurally
+                spec = self.capture_spec()
+                pagesize = PAPER_SIZES.get(self.paper_format_combo.currentText(), A4) if default_ext == ".ps" else None
+                with open(file_path, 'w') as f:
+                    f.write(render_disc_postscript(spec, pagesize))
+                QMessageBox.information(self, "Success", f"File saved successfully to {file_path}")
+                
+                # Compare the written file with the SVG when a PostScript interpreter is available
+                self.report_postscript_validation(file_path, spec)
+                return
             else:
                 # Save as PDF (convert SVG to PDF)
-                drawing = svg2rlg(self.temp_svg_file.name)
-                
-                # Get the disc diameter in points (1 mm = 2.83465 points)
-                disc_diameter_mm = self.diameter_input.value()
-                disc_diameter_pt = disc_diameter_mm * 2.83465
-                
-                # Set paper size based on selection
-                paper_format = self.paper_format_combo.currentText()
-                if paper_format == "A4":
-                    pagesize = A4
-                elif paper_format == "Letter":
-                    pagesize = LETTER
-                elif paper_format == "Legal":
-                    pagesize = LEGAL
-                elif paper_format == "A3":
-                    pagesize = A3
-                else:
-                    pagesize = A4  # Default to A4
-                
-                # Get page dimensions in points
-                page_width, page_height = pagesize
-                
-                # Calculate the position to center the disc on the page
-                # without scaling (maintaining the exact size in mm)
-                x_offset = (page_width - disc_diameter_pt) / 2
-                y_offset = (page_height - disc_diameter_pt) / 2
-                
-                # Create a new drawing with the correct page size
-                from reportlab.graphics.shapes import Drawing, Group
-                
-                # Create a new drawing with the page size
-                new_drawing = Drawing(page_width, page_height)
-                
-                # Center the original drawing without scaling
-                group = Group(drawing)
-                # Scale the drawing to match the desired size in points
-                scale_factor = disc_diameter_pt / drawing.width
-                group.scale(scale_factor, scale_factor)
-                group.translate(x_offset, y_offset)
-                
-                # Add the centered group to the new drawing
-                new_drawing.add(group)
+                pagesize = PAPER_SIZES.get(self.paper_format_combo.currentText(), A4)
+                new_drawing = build_pdf_page_drawing(self.temp_svg_file.name, self.diameter_input.value(), pagesize)
                 
                 # Render the new drawing to PDF
                 renderPDF.drawToFile(new_drawing, file_path, pagesize=pagesize)
@@ -834,10 +3497,59 @@ class StroboscopeMultiRingsGenerator(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error saving file: {e}")
     
+    def report_postscript_validation(self, file_path, spec):
+        # Validates an exported PostScript file against the SVG preview in the
+        # background. The file is already saved, so problems are reported as
+        # warnings only.
+        self.stop_validation()
+        svg = self.preview_cache.get(spec) or render_disc_svg(spec)
+        self.validation_task = BackgroundTask(validate_postscript, file_path, svg, spec.diameter, parent=self)
+        self.validation_task.task_failed.connect(self.postscript_validation_failed)
+        self.validation_task.task_finished.connect(self.postscript_validation_finished)
+        self.statusBar().showMessage(f"Validating {os.path.basename(file_path)}...")
+        self.validation_task.start()
+    
+    def stop_validation(self):
+        # Cancels a validation still running and waits for its thread
+        if self.validation_task and self.validation_task.isRunning():
+            self.validation_task.task_failed.disconnect()
+            self.validation_task.task_finished.disconnect()
+            self.validation_task.requestInterruption()
+            self.validation_task.wait()
+    
+    def postscript_validation_failed(self, message):
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Validation", f"The file was saved, but it could not be validated: {message}")
+    
+    def postscript_validation_finished(self, validation):
+        self.statusBar().clearMessage()
+        if validation is None:
+            QMessageBox.information(self, "Validation",
+                                    "No PostScript interpreter (Ghostscript) found, the file was not validated.")
+            return
+        details = (f"Mean difference {validation['mean_difference'] * 100:.2f}%, "
+                   f"{validation['differing_pixels'] * 100:.2f}% of pixels differ.")
+        if validation['passed']:
+            QMessageBox.information(self, "Validation", f"The file matches the SVG preview. {details}")
+        else:
+            QMessageBox.warning(self, "Validation", f"The file does not match the SVG preview. {details}")
+    
+    def eventFilter(self, obj, event):
+        # Keep fields of this window from overriding the undo/redo shortcuts
+        if event.type() == QEvent.Type.ShortcutOverride and isinstance(obj, QWidget) and obj.window() is self \
+                and (event.matches(QKeySequence.StandardKey.Undo) or event.matches(QKeySequence.StandardKey.Redo)):
+            event.ignore()
+            return True
+        return super().eventFilter(obj, event)
+    
     def closeEvent(self, event):
+        self.stop_validation()
+        if self.library is not None:
+            self.library.close()
         self.temp_dir.cleanup()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = StroboscopeMultiRingsGenerator()
     window.show()
@@ -20,6 +20,7 @@ python -m nuitka MKStroboscopeDiscGeneratorGUI.py `
     --include-module=tempfile `
     --include-module=reportlab `
     --include-package=reportlab `
+    --include-package=numpy `
     --windows-console-mode=disable
 
 $output_file = "dist\MKStroboscopeDiscGeneratorGUI.exe"
@@ -19,6 +19,7 @@ python -m nuitka MKStroboscopeDiscGeneratorGUI.py \
 --include-module=tempfile \
 --include-module=reportlab \
 --include-package=reportlab \
+--include-package=numpy \
 --windows-console-mode=disable \
 --onefile
 
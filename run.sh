@@ -51,7 +51,7 @@ fi
 # Instalar dependencias
 echo -e "${BLUE}Installing dependencies...${NC}"
 pip install --upgrade pip
-pip install PyQt6 svgwrite svglib reportlab nuitka
+pip install PyQt6 svgwrite svglib reportlab numpy nuitka
 
 # Verificar si la instalación fue exitosa
 if [ $? -ne 0 ]; then
@@ -0,0 +1,28 @@
+import math
+
+from MKStroboscopeDiscGeneratorGUI import DriftAnalysisEngine
+
+
+def test_drift_at_own_speed():
+    # 33.33 rpm @ 50 Hz with 180 lines drifts slowly backwards
+    drift = DriftAnalysisEngine.drift_lines_per_second(33.33, 50, 180)
+    assert math.isclose(drift, 180 * 33.33 / 60 - 100, abs_tol=1e-9)
+
+
+def test_drift_is_folded_at_aliased_speed():
+    # Twice the speed moves the pattern by a whole number of lines per flash,
+    # so it looks almost still under the strobe
+    drift = DriftAnalysisEngine.drift_lines_per_second(66.66, 50, 180)
+    assert math.isclose(drift, -0.02, abs_tol=1e-6)
+
+
+def test_drift_grid_is_folded():
+    engine = DriftAnalysisEngine([{'rpm': 33.33, 'hz': 50, 'line_counts': [180]}])
+    engine.run()
+    result = engine.results[0]
+    assert result['hz_values'].min() >= 49.8 and result['hz_values'].max() < 50.21
+    for hz in result['hz_values']:
+        row = engine.drift_row(result, hz)
+        assert row.min() >= -hz and row.max() < hz
+    rpm_index = int(abs(engine.rpm_values - 66.66).argmin())
+    assert abs(engine.drift_row(result, 50)[rpm_index]) < 0.1
@@ -0,0 +1,47 @@
+import math
+import wave
+
+import numpy as np
+import pytest
+
+from MKStroboscopeDiscGeneratorGUI import ToneSpeedAnalyzer
+
+SAMPLE_RATE = 48000
+TONE_HZ = 3150
+DEVIATION = 0.001  # Peak frequency deviation, 0.0707% RMS
+
+
+def write_fm_wav(path, modulation_hz, bits, seconds=12):
+    # 3150 Hz test tone, frequency modulated by a sine at modulation_hz
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * TONE_HZ * (t - DEVIATION * np.cos(2 * np.pi * modulation_hz * t) / (2 * np.pi * modulation_hz))
+    signal = 0.8 * np.sin(phase)
+    if bits == 8:
+        data = np.round(signal * 127 + 128).astype(np.uint8).tobytes()
+    elif bits == 16:
+        data = np.round(signal * 32767).astype('<i2').tobytes()
+    else:
+        samples = np.round(signal * (2 ** 23 - 1)).astype('<i4')
+        data = samples.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(bits // 8)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(data)
+    return path
+
+
+@pytest.mark.parametrize('bits', [8, 16, 24])
+@pytest.mark.parametrize('modulation_hz, weighting_db', [(4, 0.0), (20, -5.9), (100, -17.3), (200, -23.0)])
+def test_wow_flutter_follows_iec_weighting(tmp_path, bits, modulation_hz, weighting_db):
+    path = write_fm_wav(tmp_path / 'tone.wav', modulation_hz, bits)
+    result = ToneSpeedAnalyzer(TONE_HZ).run(str(path))
+    expected = DEVIATION / math.sqrt(2) * 100 * 10 ** (weighting_db / 20)
+    assert abs(result['speed_error']) < 0.002
+    assert 20 * math.log10(result['wow_flutter_rms'] / expected) == pytest.approx(0, abs=0.5)
+
+
+def test_short_recording_has_no_wow_flutter(tmp_path):
+    path = write_fm_wav(tmp_path / 'tone.wav', 4, 16, seconds=2)
+    result = ToneSpeedAnalyzer(TONE_HZ).run(str(path))
+    assert result['wow_flutter_rms'] is None